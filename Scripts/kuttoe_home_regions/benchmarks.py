@@ -0,0 +1,532 @@
+#######################################################################################################################
+#  Imports                                                                                                            #
+#######################################################################################################################
+
+# python imports
+from collections import namedtuple, OrderedDict
+from contextlib import contextmanager
+from json import dump
+from os import path
+from random import Random
+from time import perf_counter
+from tracemalloc import start as start_tracing, stop as stop_tracing, get_traced_memory
+from typing import Dict, List, Tuple, Any
+
+# miscellaneous
+import services
+
+# sim4 imports
+from sims4.commands import Command, CommandType, Output
+from sims4.resources import Types
+from sims4.tuning.instances import lock_instance_tunables
+from sims4.utils import constproperty
+
+# interaction imports
+from interactions import ParticipantType
+
+# test imports
+from event_testing.test_variants import TunableIdentityTest
+from sims.sim_info_tests import TraitTest, SimInfoTest, _SpeciesTestSpecies
+from world.world_tests import HomeRegionTest
+from zone_tests import ZoneTest
+
+# local imports
+from kuttoe_home_regions import injections
+from kuttoe_home_regions.injections import SituationJobModifications, InjectionLayer, InjectionJournal
+from kuttoe_home_regions.injections import BypassReasonIndex, SituationJobIndex, HighSchoolSituationJobsInfo
+from kuttoe_home_regions.home_worlds import HomeWorldIds
+from kuttoe_home_regions.commands import AlterType, get_home_world_from_name
+from kuttoe_home_regions.interactions import AlterWorldListImmediateSuperInteraction
+from kuttoe_home_regions.utils import get_auto_init_factory_info, _get_auto_init_factory_info, FlyweightRegistry
+from kuttoe_home_regions.tests import NotificationSettingValueTest, PackTest, BooleanSettingValueTest
+from kuttoe_home_regions.tests import SoftFilterToggleValueTest, IsWorldAvailableTest, WorldsAvailableLeftTest
+from kuttoe_home_regions.tests import CandidatePreFilterTest, _TestSetMixin
+from kuttoe_home_regions.indexes import HomeWorldSimIndex
+
+
+#######################################################################################################################
+#  Named Tuples                                                                                                       #
+#######################################################################################################################
+
+
+BenchmarkConfig = namedtuple('BenchmarkConfig', [
+    'job_count', 'jobs_per_phase', 'phases', 'tag_ratio', 'name_prefixes', 'iterations', 'seed',
+], defaults=(8, 3, 0.1, ('job_HighSchool', 'job_Synthetic'), 3, 0))
+
+
+#######################################################################################################################
+#  Synthetic Tuning                                                                                                   #
+#######################################################################################################################
+
+
+class SyntheticSituationJob:
+    guid64 = 0
+    filter = None
+    location_based_filter_terms = tuple()
+    no_show_action = None
+    sim_auto_invite = None
+
+
+class SyntheticPhase:
+    __slots__ = ('_job_list', )
+
+    def __init__(self, jobs):
+        self._job_list = {job: None for job in jobs}
+
+
+class SyntheticSituation:
+    tags = frozenset()
+    force_invite_only = False
+    _implies_greeted_status = False
+    _phases = tuple()
+
+
+class SyntheticInstanceManager:
+    def __init__(self, manager_type: Types, tuning_classes):
+        self.TYPE = manager_type
+        self.types = OrderedDict((tuning_cls.guid64, tuning_cls) for tuning_cls in tuning_classes)
+
+    def get_ordered_types(self, only_subclasses_of=object):
+        return [tuning_cls for tuning_cls in self.types.values() if issubclass(tuning_cls, only_subclasses_of)]
+
+
+class SyntheticTuning:
+    BYPASS_TAG = 1
+    HIGH_SCHOOL_PREFIX = 'job_HighSchool'
+
+    def __init__(self, config: BenchmarkConfig):
+        self._config = config
+        self._random = Random(config.seed)
+        self._filters = (object(), object(), object())
+        self.jobs = self._create_jobs()
+        self.situations = self._create_situations()
+
+    @property
+    def config(self):
+        return self._config
+
+    def _create_jobs(self):
+        prefixes = self.config.name_prefixes or ('job_Synthetic', )
+        jobs = list()
+
+        for index in range(self.config.job_count):
+            name = '{}_{}'.format(prefixes[index % len(prefixes)], index)
+            attributes = dict(guid64=index + 1, filter=self._random.choice(self._filters))
+            jobs.append(type(name, (SyntheticSituationJob, ), attributes))
+
+        return tuple(jobs)
+
+    def _create_situations(self):
+        config = self.config
+        jobs_per_situation = max(config.jobs_per_phase * config.phases, 1)
+        situations = list()
+
+        for index in range(max(config.job_count // jobs_per_situation, 1)):
+            phases = tuple(
+                SyntheticPhase(self._random.sample(self.jobs, min(config.jobs_per_phase, len(self.jobs))))
+                for _ in range(config.phases)
+            )
+            attributes = dict(guid64=index + 1, _phases=phases)
+            if self._random.random() < config.tag_ratio:
+                attributes['tags'] = frozenset({self.BYPASS_TAG})
+            attributes['force_invite_only'] = self._random.random() < config.tag_ratio / 2
+            situations.append(type('situation_Synthetic_{}'.format(index), (SyntheticSituation, ), attributes))
+
+        return tuple(situations)
+
+    def sample_jobs(self, ratio: float) -> frozenset:
+        return frozenset(self._random.sample(self.jobs, int(len(self.jobs) * ratio)))
+
+    def sample_filter_mapping(self, ratio: float) -> Dict[Any, Tuple]:
+        return {sim_filter: tuple(self.sample_jobs(ratio / len(self._filters))) for sim_filter in self._filters}
+
+    def create_high_school_info(self, toggle_value: bool) -> HighSchoolSituationJobsInfo:
+        args = dict()
+        args['prefix_list'] = (self.HIGH_SCHOOL_PREFIX, )
+        args['blacklist'] = dict()
+        args['whitelist'] = frozenset()
+
+        return HighSchoolSituationJobsInfo(toggle_value, **args)
+
+    @property
+    def bypassed_filter(self):
+        return self._filters[0]
+
+    @property
+    def managers(self) -> Dict[Types, SyntheticInstanceManager]:
+        return {
+            Types.SITUATION: SyntheticInstanceManager(Types.SITUATION, self.situations),
+            Types.SITUATION_JOB: SyntheticInstanceManager(Types.SITUATION_JOB, self.jobs),
+        }
+
+
+#######################################################################################################################
+#  Benchmark Harness                                                                                                  #
+#######################################################################################################################
+
+
+class InjectionBenchmark:
+    STAGES = OrderedDict((
+        ('soft_filter', '_inject_soft_filter'),
+        ('force_replacement', '_inject_force_replacement'),
+        ('filter_replacement', '_replace_filters'),
+        ('fixup', '_fixup_filters_for_situation_jobs'),
+        ('main_injection', '_inject_into_situation_jobs'),
+    ))
+
+    def __init__(self, config: BenchmarkConfig):
+        self._config = config
+
+    @property
+    def config(self):
+        return self._config
+
+    @staticmethod
+    @contextmanager
+    def _patched(tuning: SyntheticTuning):
+        patches = InjectionJournal()
+        journal = InjectionJournal()
+        managers = tuning.managers
+
+        patches.set(injections, 'get_instance_manager', lambda manager_type: managers[manager_type])
+        patches.set(InjectionLayer, '_JOURNAL', journal)
+        patches.set(SituationJobModifications, 'HIGH_SCHOOL_SITUATION_JOBS_INFO', tuning.create_high_school_info)
+        patches.set(SituationJobModifications, '_BYPASS_INDEX', BypassReasonIndex())
+        patches.set(SituationJobModifications, '_JOB_INDEX', SituationJobIndex())
+        patches.set(SituationJobModifications, 'SOFT_LIST', tuning.sample_jobs(0.05))
+        patches.set(SituationJobModifications, 'BYPASS_LIST', tuning.sample_jobs(0.05))
+        patches.set(SituationJobModifications, 'SECOND_CHANCE_LIST', tuning.sample_jobs(0.01))
+        patches.set(SituationJobModifications, 'FORCED_REPLACEMENT_LIST', tuning.sample_jobs(0.05))
+        patches.set(SituationJobModifications, 'FILTER_REPLACEMENT_LIST', tuning.sample_filter_mapping(0.05))
+        patches.set(SituationJobModifications, 'SITUATION_FILTER_FIXUP', tuning.sample_filter_mapping(0.05))
+        patches.set(SituationJobModifications, 'FILTERS_TO_BYPASS', (tuning.bypassed_filter, ))
+        patches.set(SituationJobModifications, 'BYPASS_TAGS', frozenset({SyntheticTuning.BYPASS_TAG}))
+        try:
+            yield
+        finally:
+            journal.undo()
+            patches.undo()
+
+    def _run_iteration(self, seed: int) -> Dict[str, float]:
+        tuning = SyntheticTuning(self.config._replace(seed=seed))
+        timings = OrderedDict()
+
+        with self._patched(tuning):
+            for (stage_name, method_name) in self.STAGES.items():
+                start_time = perf_counter()
+                getattr(SituationJobModifications, method_name)()
+                timings[stage_name] = (perf_counter() - start_time) * 1000
+
+            timings['bypassed_jobs'] = len(SituationJobModifications.bypass_index)
+            timings['injected_values'] = len(InjectionLayer.journal)
+
+        return timings
+
+    def run(self) -> Dict[str, Any]:
+        runs: List[Dict[str, float]] = [
+            self._run_iteration(self.config.seed + iteration) for iteration in range(max(self.config.iterations, 1))
+        ]
+        stages = OrderedDict()
+
+        for stage_name in self.STAGES:
+            samples = [timings[stage_name] for timings in runs]
+            stages[stage_name] = dict(min_ms=round(min(samples), 3), mean_ms=round(sum(samples) / len(samples), 3))
+
+        stages['total'] = dict(
+            min_ms=round(min(sum(timings[name] for name in self.STAGES) for timings in runs), 3),
+            mean_ms=round(sum(sum(timings[name] for name in self.STAGES) for timings in runs) / len(runs), 3),
+        )
+
+        return dict(
+            config=self.config._asdict(),
+            bypassed_jobs=runs[-1]['bypassed_jobs'],
+            injected_values=runs[-1]['injected_values'],
+            stages=stages,
+        )
+
+
+class LegacyEnumMember:
+    __slots__ = ('_member', )
+
+    def __init__(self, member):
+        self._member = member
+
+    @property
+    def factory_value(self):
+        return self._member.factory_value
+
+    def __getattr__(self, name):
+        try:
+            return getattr(self.factory_value, name)
+        except AttributeError:
+            raise AttributeError('{} does not have an attribute named {}'.format(self._member, name))
+
+
+class EnumAttributeBenchmark:
+    def __init__(self, enum_cls=HomeWorldIds, iterations: int = 10000):
+        self._enum_cls = enum_cls
+        self._iterations = iterations
+
+    @property
+    def attribute_names(self):
+        return tuple(self._enum_cls._attribute_table.keys())
+
+    @property
+    def members(self):
+        tuned_values = getattr(self._enum_cls, '_tuned_values_mapping', dict())
+
+        return tuple(member for member in self._enum_cls if member.name in tuned_values)
+
+    def _time_access(self, objects, name: str) -> float:
+        start_time = perf_counter()
+
+        for _ in range(self._iterations):
+            for obj in objects:
+                getattr(obj, name)
+
+        return (perf_counter() - start_time) * 1e9 / (self._iterations * max(len(objects), 1))
+
+    def run(self) -> Dict[str, Any]:
+        results = OrderedDict()
+        members = self.members
+        legacy_members = tuple(LegacyEnumMember(member) for member in members)
+
+        for name in self.attribute_names:
+            before = self._time_access(legacy_members, name)
+            after = self._time_access(members, name)
+            results[name] = dict(before_ns=round(before, 1), after_ns=round(after, 1))
+
+        return dict(enum=self._enum_cls.__name__, iterations=self._iterations, attributes=results)
+
+
+class SubInteractionBenchmark:
+    ALTER_TYPES = (AlterType.ALLOW_WORLD, AlterType.DISALLOW_WORLD)
+
+    def __init__(self, world_count: int):
+        self._world_count = world_count
+
+    @property
+    def worlds(self):
+        return tuple(range(1, self._world_count + 1))
+
+    @staticmethod
+    def _create_sub_interaction(source_world: int, target_world: int, alter_type: AlterType):
+        class _AlterWorldInteraction(AlterWorldListImmediateSuperInteraction):
+            pass
+
+        locked_args = dict()
+        locked_args['source_world'] = source_world
+        locked_args['target_home_world'] = target_world
+        locked_args['alter_type'] = alter_type
+        interaction_name = 'kuttoe_Benchmark_{}_{}_{}'.format(alter_type.name, source_world, target_world)
+        _AlterWorldInteraction.__name__ = interaction_name
+        lock_instance_tunables(_AlterWorldInteraction, **locked_args)
+
+        return _AlterWorldInteraction
+
+    def _measure(self, pairs) -> Dict[str, Any]:
+        start_tracing()
+        start_time = perf_counter()
+
+        classes = [self._create_sub_interaction(*pair) for pair in pairs]
+
+        elapsed_ms = (perf_counter() - start_time) * 1000
+        memory, _ = get_traced_memory()
+        stop_tracing()
+
+        return dict(classes=len(classes), elapsed_ms=round(elapsed_ms, 3), memory_kb=round(memory / 1024, 1))
+
+    def run(self) -> Dict[str, Any]:
+        worlds = self.worlds
+        eager_pairs = tuple(
+            (source_world, target_world, alter_type)
+            for alter_type in self.ALTER_TYPES
+            for source_world in worlds
+            for target_world in worlds
+            if source_world != target_world
+        )
+        first_picker_pairs = tuple(
+            (worlds[0], target_world, AlterType.ALLOW_WORLD) for target_world in worlds[1:]
+        )
+
+        return dict(
+            world_count=self._world_count,
+            eager_startup=self._measure(eager_pairs),
+            lazy_startup=self._measure(tuple()),
+            lazy_first_picker=self._measure(first_picker_pairs),
+        )
+
+
+class FactoryConstructionBenchmark:
+    def __init__(self, iterations: int = 1000):
+        self._iterations = iterations
+
+    @constproperty
+    def factory_types():
+        return (
+            (NotificationSettingValueTest, True),
+            (PackTest, True),
+            (BooleanSettingValueTest, True),
+            (SoftFilterToggleValueTest, True),
+            (IsWorldAvailableTest, True),
+            (WorldsAvailableLeftTest, True),
+            (HomeRegionTest, True),
+            (TraitTest, True),
+            (TunableIdentityTest, False),
+            (_SpeciesTestSpecies, True),
+            (SimInfoTest, True),
+            (ZoneTest, True),
+        )
+
+    def _time_construction(self, info_getter, factory_cls, has_factory: bool) -> float:
+        start_time = perf_counter()
+
+        for _ in range(self._iterations):
+            factory, defaults = info_getter(factory_cls, has_factory)
+            factory(**{**defaults})
+
+        return (perf_counter() - start_time) * 1e6 / self._iterations
+
+    def run(self) -> Dict[str, Any]:
+        results = OrderedDict()
+
+        for (factory_cls, has_factory) in self.factory_types:
+            before = self._time_construction(_get_auto_init_factory_info, factory_cls, has_factory)
+            after = self._time_construction(get_auto_init_factory_info, factory_cls, has_factory)
+            results[factory_cls.__name__] = dict(before_us=round(before, 2), after_us=round(after, 2))
+
+        return dict(iterations=self._iterations, factories=results)
+
+
+class CandidatePreFilterCheck:
+    def __init__(self, home_world: HomeWorldIds):
+        args = dict()
+        args['participant'] = ParticipantType.PickedSim
+        args['target_home_world'] = home_world
+        args['blacklist_traits'] = _TestSetMixin.TRAIT_BLACKLIST
+
+        self._home_world = home_world
+        self._test = FlyweightRegistry.construct(CandidatePreFilterTest, **args)
+
+    def run(self) -> Dict[str, Any]:
+        passed, rejected, index_mismatches = 0, 0, 0
+        index = HomeWorldSimIndex.get()
+
+        for sim_info in services.sim_info_manager().get_all():
+            if self._test(subjects=(sim_info, )):
+                passed += 1
+            else:
+                rejected += 1
+
+            in_world = HomeWorldSimIndex.get_world_id(sim_info) == self._home_world.value
+            if in_world != index.is_in_world(sim_info, self._home_world.value):
+                index_mismatches += 1
+
+        args = dict()
+        args['home_world'] = self._home_world.name
+        args['passed'] = passed
+        args['rejected'] = rejected
+        args['rejection_rate'] = round(rejected / (passed + rejected), 4) if passed + rejected else 0.0
+        args['index_mismatches'] = index_mismatches
+        args['totals'] = CandidatePreFilterTest.get_stats()
+
+        return args
+
+
+def write_benchmark_results(file_name: str, results, file_path: str = None) -> str:
+    from kuttoe_home_regions.settings import Settings
+
+    file_path = path.join(file_path or Settings.gv_directory.directory_path, file_name)
+    with open(file_path, 'w+') as file:
+        dump(results, file, indent=4)
+
+    return file_path
+
+
+#######################################################################################################################
+#  Benchmark Console Commands                                                                                         #
+#######################################################################################################################
+
+
+@Command('kuttoe.benchmark_injections', command_type=CommandType.Cheat)
+def benchmark_injections(job_count: int = 0, phases: int = 3, tag_ratio: float = 0.1, iterations: int = 3,
+                         file_path: str = None, _connection=None):
+    output = Output(_connection)
+    job_counts = (job_count, ) if job_count > 0 else (1000, 10000, 100000)
+    results = list()
+
+    for count in job_counts:
+        config = BenchmarkConfig(job_count=count, phases=phases, tag_ratio=tag_ratio, iterations=iterations)
+        result = InjectionBenchmark(config).run()
+        results.append(result)
+
+        output('{} jobs: {:.1f} ms total'.format(count, result['stages']['total']['mean_ms']))
+
+    file_path = write_benchmark_results('Kuttoe_Injection_Benchmark.json', results, file_path)
+    output(f'Successfully wrote benchmark results to file: {file_path}')
+
+    return True
+
+
+@Command('kuttoe.benchmark_enum_access', command_type=CommandType.Cheat)
+def benchmark_enum_access(iterations: int = 10000, file_path: str = None, _connection=None):
+    output = Output(_connection)
+    result = EnumAttributeBenchmark(HomeWorldIds, iterations).run()
+
+    for (name, timings) in result['attributes'].items():
+        output('{}: {} ns -> {} ns'.format(name, timings['before_ns'], timings['after_ns']))
+
+    file_path = write_benchmark_results('Kuttoe_Enum_Access_Benchmark.json', result, file_path)
+    output(f'Successfully wrote benchmark results to file: {file_path}')
+
+    return True
+
+
+@Command('kuttoe.benchmark_sub_interactions', command_type=CommandType.Cheat)
+def benchmark_sub_interactions(world_count: int = 0, file_path: str = None, _connection=None):
+    output = Output(_connection)
+    world_counts = (world_count, ) if world_count > 0 else (10, 50, 200)
+    results = list()
+
+    for count in world_counts:
+        result = SubInteractionBenchmark(count).run()
+        results.append(result)
+
+        output('{} worlds: eager {} classes in {:.1f} ms ({} KiB), lazy first picker {} classes in {:.1f} ms'.format(
+            count, result['eager_startup']['classes'], result['eager_startup']['elapsed_ms'],
+            result['eager_startup']['memory_kb'], result['lazy_first_picker']['classes'],
+            result['lazy_first_picker']['elapsed_ms']))
+
+    file_path = write_benchmark_results('Kuttoe_Sub_Interaction_Benchmark.json', results, file_path)
+    output(f'Successfully wrote benchmark results to file: {file_path}')
+
+    return True
+
+
+@Command('kuttoe.benchmark_factory_construction', command_type=CommandType.Cheat)
+def benchmark_factory_construction(iterations: int = 1000, file_path: str = None, _connection=None):
+    output = Output(_connection)
+    result = FactoryConstructionBenchmark(iterations).run()
+
+    for (name, timings) in result['factories'].items():
+        output('{}: {} us -> {} us'.format(name, timings['before_us'], timings['after_us']))
+
+    file_path = write_benchmark_results('Kuttoe_Factory_Construction_Benchmark.json', result, file_path)
+    output(f'Successfully wrote benchmark results to file: {file_path}')
+
+    return True
+
+
+@Command('kuttoe.check_candidate_prefilter', command_type=CommandType.Cheat)
+def check_candidate_prefilter(*home_world_name, _connection=None):
+    output = Output(_connection)
+    home_world = get_home_world_from_name(*home_world_name, _connection=_connection)
+    if home_world is None:
+        return False
+
+    result = CandidatePreFilterCheck(home_world).run()
+    output('Candidate pre-filter for {}: {} passed, {} rejected (rate {}), {} index mismatches'.format(
+        result['home_world'], result['passed'], result['rejected'], result['rejection_rate'],
+        result['index_mismatches']))
+
+    return result['index_mismatches'] == 0
@@ -2,15 +2,17 @@
 #  Imports                                                                                                            #
 #######################################################################################################################
 
-from typing import List, Optional, Callable, Any, Dict, Union
+from typing import List, Optional, Callable, Any, Dict, Union, Iterable, Tuple
 from collections import defaultdict
 import enum
 import services
 from sims4.commands import Command, CommandType, Output
 from server_commands.argument_helpers import OptionalSimInfoParam, get_optional_target
 from sims.sim_info_manager import SimInfoManager
-from kuttoe_home_regions.home_worlds import HomeWorldIds
+from kuttoe_home_regions.home_worlds import HomeWorldIds, WorldNameResolver, WorldNameMatchType
 from kuttoe_home_regions.ui import NotificationType
+from kuttoe_home_regions.utils import TimeSlicedJob, FlyweightRegistry
+from kuttoe_home_regions.indexes import SimNameIndex, NameMatchType, HomeWorldSimIndex
 
 
 #######################################################################################################################
@@ -23,6 +25,13 @@ class AlterType(enum.Int):
     DISALLOW_WORLD = 1
 
 
+class BulkSelector(enum.Int):
+    HOUSEHOLD = 0
+    HOME_WORLD = 1
+    TOWNIES = 2
+    SIMS = 3
+
+
 #######################################################################################################################
 #  Helper Functions                                                                                                   #
 #######################################################################################################################
@@ -35,20 +44,18 @@ def kuttoe_set_world_id(home_world_id: HomeWorldIds, sim_info, _connection=None)
     if sim_info is None:
         return False
 
-    household = getattr(sim_info, 'household', None)
     sim_name = '{} {}'.format(sim_info.first_name, sim_info.last_name)
-    if household is None:
+    assignment = kuttoe_bulk_set_world_id(home_world_id, (sim_info, ), time_sliced=False)
+    if not assignment.updated_sims:
         output('Sim {} has no household object'.format(sim_name))
         return False
 
-    household._home_world_id = value
-    home_world_id.apply_fixup_to_sim_info(sim_info)
     output('Home world ID for {} ({}) is now {} ({})'.format(sim_name, sim_info.id, name, value))
 
     return True
 
 
-def get_home_world_from_name(*home_world_name, _connection=None) -> Optional[HomeWorldIds]:
+def get_home_world_from_name(*home_world_name, exact_only: bool = False, _connection=None) -> Optional[HomeWorldIds]:
     output = Output(_connection)
     world_key = ' '.join(home_world_name).upper().replace(' ', '_')
 
@@ -56,13 +63,41 @@ def get_home_world_from_name(*home_world_name, _connection=None) -> Optional[Hom
         output('Missing World name!')
         return None
 
-    if world_key not in HomeWorldIds:
-        world_list = HomeWorldIds.world_list
-        output('Invalid World name: {}\n\nValid World names: {}'.format(world_key, world_list))
+    resolution = WorldNameResolver.resolve(*home_world_name)
+    if resolution.match_type in (WorldNameMatchType.EXACT, WorldNameMatchType.ALIAS):
+        return resolution.world
+    if resolution.world is not None and not exact_only:
+        output('Resolved World name {} to {}'.format(world_key, resolution.world.name))
+        return resolution.world
 
-        return None
+    suggestions = (resolution.world, ) if resolution.world is not None else resolution.suggestions
+    if suggestions:
+        suggestion_names = ', '.join(world.name for world in suggestions)
+        output('Invalid World name: {}\n\nDid you mean: {}'.format(world_key, suggestion_names))
+    else:
+        output('Invalid World name: {}\n\nValid World names: {}'.format(world_key, HomeWorldIds.world_list))
+
+    return None
 
-    return HomeWorldIds[world_key]
+
+def find_sim_infos_by_name(first_name: str, last_name: str = '', allow_ambiguous: bool = True,
+                           _connection=None) -> tuple:
+    output = Output(_connection)
+    full_name = ' '.join(name for name in (first_name, last_name) if name)
+    match = SimNameIndex.get().find(first_name, last_name)
+
+    if match.match_type == NameMatchType.NONE:
+        output('No Sim found with name {}'.format(full_name))
+        return tuple()
+
+    if not allow_ambiguous and len(match.sim_infos) > 1:
+        output('Multiple Sims match name {}; use kuttoe.set_world_id with one of these Sim IDs:'.format(full_name))
+        for sim_info in match.sim_infos:
+            output('{} {} ({})'.format(sim_info.first_name, sim_info.last_name, sim_info.id))
+
+        return tuple()
+
+    return match.sim_infos
 
 
 def get_notification_type_from_name(*notification_type_name, _connection=None) -> Optional[NotificationType]:
@@ -80,23 +115,28 @@ def get_notification_type_from_name(*notification_type_name, _connection=None) -
     return NotificationType[notif_key]
 
 
+def get_dump_file_path(file_name: str, file_path: str = None) -> str:
+    from kuttoe_home_regions.settings import Settings
+    from os import path
+
+    return path.join(file_path or Settings.gv_directory.directory_path, file_name)
+
+
 def dump_data_to_file(
-        file_name: str, data: dict, file_path: str = None, _connection=None,
+        file_name: str, data: Union[dict, Iterable[Tuple[Any, Any]]], file_path: str = None, _connection=None,
         file_writer: Callable[[Union[str, int], Any], str] = None
 ):
-    from kuttoe_home_regions.settings import Settings
-    from os import path
     from subprocess import Popen
 
     output = Output(_connection)
-    gv_data = Settings.gv_directory
-    file_path = path.join(file_path or gv_data.directory_path, file_name)
+    file_path = get_dump_file_path(file_name, file_path)
 
     def _default_file_writer(item_key, item_value):
         return f'{item_key}: {item_value}\n\n'
 
+    items = data.items() if isinstance(data, dict) else data
     with open(file_path, 'w+') as file:
-        for (key, value) in data.items():
+        for (key, value) in items:
             file.write((file_writer or _default_file_writer)(key, value))
 
     output(f'Successfully wrote data to file: {file_path}')
@@ -104,6 +144,133 @@ def dump_data_to_file(
     return True
 
 
+#######################################################################################################################
+#  Bulk Assignment                                                                                                    #
+#######################################################################################################################
+
+
+class BulkWorldIdAssignment:
+    TIME_SLICE_THRESHOLD = 200
+
+    def __init__(self, home_world: HomeWorldIds, sim_infos: Iterable, _connection=None, on_complete=None):
+        self._home_world = home_world
+        self._sim_infos = tuple(sim_info for sim_info in sim_infos if sim_info is not None)
+        self._connection = _connection
+        self._on_complete = on_complete
+        self._households = set()
+        self._updated_sims = 0
+        self._skipped_sims = 0
+        self._trait_changes = 0
+
+    @property
+    def home_world(self):
+        return self._home_world
+
+    @property
+    def sim_infos(self):
+        return self._sim_infos
+
+    @property
+    def updated_sims(self) -> int:
+        return self._updated_sims
+
+    @property
+    def trait_changes(self) -> int:
+        return self._trait_changes
+
+    @property
+    def summary(self) -> str:
+        return 'Home world ID set to {} ({}) for {} Sims across {} households ({} trait changes, {} skipped)'.format(
+            self.home_world.desc, self.home_world.value, self._updated_sims, len(self._households),
+            self._trait_changes, self._skipped_sims)
+
+    def _apply(self, sim_info):
+        household = getattr(sim_info, 'household', None)
+        if household is None:
+            self._skipped_sims += 1
+            return
+
+        if household.id not in self._households:
+            household._home_world_id = self.home_world.value
+            self._households.add(household.id)
+            HomeWorldSimIndex.notify_household_changed(household)
+
+        self._trait_changes += self.home_world.apply_fixup_to_sim_info(sim_info) or 0
+        self._updated_sims += 1
+
+    def _complete(self, _job=None):
+        if self._connection is not None:
+            Output(self._connection)(self.summary)
+        if self._on_complete is not None:
+            self._on_complete(self)
+
+    def run(self, time_sliced: bool = None):
+        if time_sliced is None:
+            time_sliced = len(self._sim_infos) > self.TIME_SLICE_THRESHOLD
+
+        if time_sliced:
+            TimeSlicedJob(self._sim_infos, self._apply, on_complete=self._complete).start()
+        else:
+            for sim_info in self._sim_infos:
+                self._apply(sim_info)
+            self._complete()
+
+        return self
+
+
+def _get_household_sim_infos(household_id: int = None):
+    household = services.household_manager().get(household_id) if household_id else services.active_household()
+
+    return tuple(household.sim_info_gen()) if household is not None else tuple()
+
+
+def _get_home_world_sim_infos(home_world: HomeWorldIds):
+    return tuple(
+        sim_info
+        for sim_info in services.sim_info_manager().get_all()
+        if getattr(sim_info.household, '_home_world_id', None) == home_world.value
+    )
+
+
+def _get_townie_sim_infos():
+    return tuple(
+        sim_info
+        for household in services.household_manager().get_all()
+        if not household.is_played_household
+        for sim_info in household.sim_info_gen()
+    )
+
+
+def _get_sim_infos_by_id(*sim_ids: int):
+    manager: SimInfoManager = services.sim_info_manager()
+
+    return tuple(manager.get(sim_id) for sim_id in sim_ids)
+
+
+def get_bulk_sim_infos(selector: BulkSelector, *selector_args, _connection=None) -> Optional[tuple]:
+    output = Output(_connection)
+
+    try:
+        if selector == BulkSelector.HOUSEHOLD:
+            return _get_household_sim_infos(*(int(arg) for arg in selector_args[:1]))
+        elif selector == BulkSelector.HOME_WORLD:
+            home_world = get_home_world_from_name(*selector_args, exact_only=True, _connection=_connection)
+            return _get_home_world_sim_infos(home_world) if home_world is not None else None
+        elif selector == BulkSelector.TOWNIES:
+            return _get_townie_sim_infos()
+        elif selector == BulkSelector.SIMS:
+            return _get_sim_infos_by_id(*(int(arg) for arg in selector_args))
+    except ValueError:
+        output('Invalid arguments for selector {}: {}'.format(selector.name, ' '.join(selector_args)))
+
+    return None
+
+
+def kuttoe_bulk_set_world_id(home_world_id: HomeWorldIds, sim_infos: Iterable, _connection=None,
+                             time_sliced: bool = None, on_complete=None) -> BulkWorldIdAssignment:
+    return BulkWorldIdAssignment(home_world_id, sim_infos, _connection, on_complete).run(time_sliced)
+
+
 #######################################################################################################################
 #  Base Console Command                                                                                               #
 #######################################################################################################################
@@ -133,6 +300,7 @@ def _alter_worlds_list_helper(
         source_world: HomeWorldIds,
         target_world: HomeWorldIds,
         alter_type: AlterType,
+        pending_settings: Dict[str, Any],
         _connection=None):
     from kuttoe_home_regions.settings import Settings
 
@@ -143,7 +311,11 @@ def _alter_worlds_list_helper(
 
         return False
 
-    world_list: List[str] = Settings.get_world_settings(source_world)['Worlds']
+    setting_key = '{}_Worlds'.format(source_world.settings_name_base)
+    if setting_key not in pending_settings:
+        pending_settings[setting_key] = list(Settings.get_world_settings(source_world)['Worlds'])
+
+    world_list: List[str] = pending_settings[setting_key]
     if alter_type == AlterType.ALLOW_WORLD:
         if target_world.name in world_list:
             output('{} is already in {}\'s allowed Worlds list!'.format(target_world.desc, source_world.desc))
@@ -160,7 +332,6 @@ def _alter_worlds_list_helper(
         world_list.remove(target_world.name)
         msg = 'removed from'
 
-    Settings.update_setting('{}_Worlds'.format(source_world.settings_name_base), world_list)
     output('World {} {} {}\'s list of Worlds Townies are allowed to come from'.format(
         target_world.desc, msg, source_world.desc
     ))
@@ -168,19 +339,37 @@ def _alter_worlds_list_helper(
     return True
 
 
+def kuttoe_settings_bulk_alter_worlds_list(source_world: HomeWorldIds,
+                                           target_worlds: Iterable[HomeWorldIds],
+                                           alter_type: AlterType,
+                                           _connection=None) -> bool:
+    from kuttoe_home_regions.settings import Settings
+
+    pending_settings = dict()
+    bidirectional = Settings.bidirectional_toggle
+
+    for target_world in target_worlds:
+        _alter_worlds_list_helper(source_world, target_world, alter_type, pending_settings, _connection)
+        if bidirectional:
+            _alter_worlds_list_helper(target_world, source_world, alter_type, pending_settings, _connection)
+
+    current_settings = Settings.settings
+    changed_settings = {key: value for key, value in pending_settings.items() if value != current_settings.get(key)}
+    if not changed_settings:
+        return False
+
+    return Settings.update_settings(changed_settings)
+
+
 def kuttoe_settings_alter_worlds_list(source_world: HomeWorldIds,
                                       *home_world_name,
                                       alter_type: AlterType,
                                       _connection=None):
-    from kuttoe_home_regions.settings import Settings
-
     home_world = get_home_world_from_name(*home_world_name, _connection=_connection)
     if home_world is None:
         return False
 
-    _alter_worlds_list_helper(source_world, home_world, alter_type, _connection)
-    if Settings.bidirectional_toggle:
-        _alter_worlds_list_helper(home_world, source_world, alter_type, _connection)
+    kuttoe_settings_bulk_alter_worlds_list(source_world, (home_world, ), alter_type, _connection)
 
     return True
 
@@ -206,36 +395,58 @@ def set_world_id(*home_world_name, opt_sim: OptionalSimInfoParam = None, _connec
 
 @Command('kuttoe.set_world_id_by_sim_name', command_type=CommandType.Live)
 def set_world_id_by_sim_name(first_name: str, last_name: str = '', *home_world_name, _connection=None):
-    manager: SimInfoManager = services.sim_info_manager()
-    sim_info = manager.get_sim_info_by_name(first_name, last_name)
+    sim_infos = find_sim_infos_by_name(first_name, last_name, allow_ambiguous=False, _connection=_connection)
+    if not sim_infos:
+        return False
+
+    home_world = get_home_world_from_name(*home_world_name, _connection=_connection)
+    if home_world is None:
+        return False
+
+    return kuttoe_set_world_id(home_world, sim_infos[0], _connection=_connection)
+
+
+@Command('kuttoe.bulk_set_world_id', command_type=CommandType.Live)
+def bulk_set_world_id(home_world_name: str, selector_name: str, *selector_args, _connection=None):
+    output = Output(_connection)
+    home_world = get_home_world_from_name(home_world_name, exact_only=True, _connection=_connection)
+    selector_key = selector_name.upper()
+
+    if home_world is None:
+        return False
+    if selector_key not in BulkSelector:
+        output('Invalid selector: {}\n\nValid selectors: {}'.format(
+            selector_key, ', '.join(selector.name for selector in BulkSelector)))
+        return False
 
-    if not sim_info:
-        full_name = ' '.join(*(first_name, last_name,))
-        Output(_connection)('No Sim found with name {}'.format(full_name))
+    sim_infos = get_bulk_sim_infos(BulkSelector[selector_key], *selector_args, _connection=_connection)
+    if sim_infos is None:
         return False
 
-    opt_sim = OptionalSimInfoParam(str(sim_info.id))
-    return set_world_id(*home_world_name, opt_sim=opt_sim, _connection=_connection)
+    kuttoe_bulk_set_world_id(home_world, sim_infos, _connection=_connection)
+    return True
 
 
 @Command('kuttoe.get_world_id_by_sim_name')
 def get_world_id_by_sim_name(first_name: str, last_name: str = '', _connection=None):
-    manager: SimInfoManager = services.sim_info_manager()
-    sim_info = manager.get_sim_info_by_name(first_name, last_name)
+    sim_infos = find_sim_infos_by_name(first_name, last_name, _connection=_connection)
     output = Output(_connection)
 
-    if not sim_info:
-        full_name = ' '.join(*(first_name, last_name,))
-        output('No Sim found with name {}'.format(full_name))
+    if not sim_infos:
         return False
 
-    household = getattr(sim_info, 'household', None)
-    sim_name = '{} {}'.format(sim_info.first_name, sim_info.last_name)
-    if household is None:
-        output('Sim {} has no household object'.format(sim_name))
-        return False
+    for sim_info in sim_infos:
+        household = getattr(sim_info, 'household', None)
+        sim_name = '{} {}'.format(sim_info.first_name, sim_info.last_name)
+        if household is None:
+            output('Sim {} has no household object'.format(sim_name))
+            continue
+
+        home_world = HomeWorldIds.from_world_id(household._home_world_id)
+        world_name = home_world.name if home_world is not None else 'UNKNOWN'
+        output('Home world ID for {} ({}) is {} ({})'.format(
+            sim_name, sim_info.id, household._home_world_id, world_name))
 
-    output('Home world ID for {} ({}) is {}'.format(sim_name, sim_info.id, household._home_world_id))
     return True
 
 
@@ -286,17 +497,97 @@ def dump_filters(file_path: str = None, _connection=None):
     return dump_data_to_file(file_name, filters, file_path, _connection, file_writer=_dump_item)
 
 
+@Command('kuttoe.reload_injections', command_type=CommandType.Cheat)
+def reload_injections(_connection=None):
+    from kuttoe_home_regions.injections import InjectionLayer
+    from time import perf_counter
+
+    start_time = perf_counter()
+    undone, applied = InjectionLayer.reload()
+    elapsed_ms = (perf_counter() - start_time) * 1000
+
+    Output(_connection)('Reverted {} injected tuning values and re-applied {} in {:.1f} ms'.format(
+        undone, applied, elapsed_ms))
+    return True
+
+
+@Command('kuttoe.refresh_available_worlds', command_type=CommandType.Cheat)
+def refresh_available_worlds(_connection=None):
+    from kuttoe_home_regions.home_worlds import AvailableWorlds
+
+    AvailableWorlds.invalidate()
+    Output(_connection)('Available Worlds: {}'.format(HomeWorldIds.world_list))
+    return True
+
+
+@Command('kuttoe.dump_startup_profile', command_type=CommandType.Cheat)
+def dump_startup_profile(file_path: str = None, _connection=None):
+    from kuttoe_home_regions.profiling import StartupProfiler
+    from kuttoe_home_regions.tests import CandidatePreFilterTest
+
+    FlyweightRegistry.report()
+    CandidatePreFilterTest.report()
+    file_name = 'Kuttoe_Startup_Profile.txt'
+
+    return dump_data_to_file(file_name, StartupProfiler.report, file_path, _connection)
+
+
+@Command('kuttoe.dump_test_order', command_type=CommandType.Cheat)
+def dump_test_order(file_path: str = None, _connection=None):
+    from kuttoe_home_regions.tests import AdaptiveTestList
+
+    file_name = 'Kuttoe_Test_Order_Dump.txt'
+
+    def _dump_item(key, value):
+        rows = ''.join('  {}: calls={}, rejection_rate={}, mean_cost_us={}\n'.format(*row) for row in value)
+        return f'{key}:\n{rows}\n'
+
+    items = ((name, tuple(test_list.diagnostics)) for (name, test_list) in AdaptiveTestList.get_registered().items())
+    return dump_data_to_file(file_name, items, file_path, _connection, file_writer=_dump_item)
+
+
 @Command('kuttoe.dump_bypassed_sjs', command_type=CommandType.Cheat)
 def dump_bypassed_situation_jobs(file_path: str = None, _connection=None):
-    from kuttoe_home_regions.injections import SituationJobModifications
+    from kuttoe_home_regions.injections import SituationJobModifications, BypassReason
     from kuttoe_home_regions.settings import Settings
 
-    situation_jobs_info = {
-        "high_school_filter": Settings.high_school_toggle,
-        "soft_filter": SituationJobModifications.soft_list,
-        "bypassed_jobs": SituationJobModifications._BYPASSED_JOBS,
-    }
+    bypass_index = SituationJobModifications.bypass_index
     file_name = 'Kuttoe_Situation_Jobs_Dump.txt'
 
-    return dump_data_to_file(file_name, situation_jobs_info, file_path, _connection)
+    def _situation_jobs_info():
+        yield 'high_school_filter', Settings.high_school_toggle
+        yield 'soft_filter', SituationJobModifications.soft_list
+        yield 'bypassed_jobs', len(bypass_index)
+
+        for (situation_job, reasons) in bypass_index.iter_items():
+            yield situation_job.__name__, '{} ({})'.format(BypassReason.describe(reasons), situation_job.guid64)
+
+    def _dump_item(key, value):
+        return f'{key}: {value}\n'
+
+    return dump_data_to_file(file_name, _situation_jobs_info(), file_path, _connection, file_writer=_dump_item)
+
 
+@Command('kuttoe.explain_job', command_type=CommandType.Cheat)
+def explain_situation_job(job_name: str, _connection=None):
+    from kuttoe_home_regions.injections import SituationJobModifications, BypassReason
+
+    output = Output(_connection)
+    job_index = SituationJobModifications.job_index
+    situation_job = job_index.get_job_by_name(job_name)
+
+    if situation_job is None:
+        output('No Situation Job found with name {}'.format(job_name))
+        return False
+
+    reasons = SituationJobModifications.bypass_index.get_reasons(situation_job)
+    situations = ', '.join(sorted(situation.__name__ for situation in job_index.get_situations(situation_job)))
+    if reasons:
+        output('Situation Job {} ({}) is bypassed: {}'.format(
+            situation_job.__name__, situation_job.guid64, BypassReason.describe(reasons)))
+    else:
+        output('Situation Job {} ({}) receives the home region filter'.format(
+            situation_job.__name__, situation_job.guid64))
+    output('Used by {} phase(s) in situations: {}'.format(len(job_index.get_usages(situation_job)), situations or '-'))
+
+    return True
@@ -6,7 +6,7 @@
 from collections import namedtuple, OrderedDict
 
 # miscellaneous
-from typing import Dict, Union, Tuple
+from typing import Dict, Union, Tuple, Any
 
 import enum
 from singletons import DEFAULT, DefaultType
@@ -35,19 +35,44 @@ EnumItem = namedtuple('EnumItem', ('enum_name', 'enum_value', 'enum_info'))
 
 
 class DynamicFactoryEnumMixin:
+    _attribute_table: Dict[str, Dict[Any, Any]] = dict()
+    _reverse_indexes: Dict[str, Dict[Any, Any]] = dict()
+
     @property
     def factory_value(self):
         return self._tuned_values_mapping[self.name]
 
-    def __getattr__(self, name):
+    def _get_factory_attribute(self, name):
         try:
             return getattr(self.factory_value, name)
         except AttributeError:
             raise AttributeError('{} does not have an attribute named {}'.format(self, name))
 
+    def __getattr__(self, name):
+        return self._get_factory_attribute(name)
+
     def __repr__(self):
         return '<%s.%s: %s = %s>' % (type(self).__name__, self.name, super().__repr__(), self.factory_value)
 
+    @classmethod
+    def on_finalize(cls):
+        pass
+
+
+#######################################################################################################################
+#  Helper Functions                                                                                                   #
+#######################################################################################################################
+
+
+def _create_flattened_property(name: str, values: Dict[Any, Any]):
+    def _get_value(member):
+        try:
+            return values[member]
+        except KeyError:
+            return member._get_factory_attribute(name)
+
+    return property(_get_value)
+
 
 #######################################################################################################################
 #  Tunables                                                                                                           #
@@ -56,8 +81,13 @@ class DynamicFactoryEnumMixin:
 
 class EnumItemFactory(TunableSingletonFactory):
     __slots__ = ()
+    FLATTENED_ATTRIBUTES: Tuple[str, ...] = ()
+    REVERSE_INDEXES: Dict[str, str] = dict()
 
     class TunableReferenceMixin:
+        _TRACKED_MANAGERS = set()
+        _LOADED_MANAGERS = set()
+
         @classmethod
         def _verify_resource_class(cls, resource, class_restrictions=()):
             if resource is None or len(class_restrictions) == 0:
@@ -108,6 +138,36 @@ class EnumItemFactory(TunableSingletonFactory):
 
             return Tunable(tunable_type=int, default=0, allow_empty=tunable._allow_none)
 
+        @classmethod
+        def _on_manager_loaded(cls, manager):
+            cls._LOADED_MANAGERS.add(manager.TYPE)
+
+        @classmethod
+        def _track_manager(cls, reference: TunableReference):
+            manager = reference._manager
+
+            if manager.TYPE not in cls._TRACKED_MANAGERS:
+                cls._TRACKED_MANAGERS.add(manager.TYPE)
+                manager.add_on_load_complete(cls._on_manager_loaded)
+
+        @classmethod
+        def is_manager_loaded(cls, reference: TunableReference) -> bool:
+            return reference._manager.TYPE in cls._LOADED_MANAGERS
+
+        def _create_property(self, reference: TunableReference, prop_name: str, cache_key: str):
+            def prop_getter(me):
+                cache = getattr(me, '__dict__', None)
+                if cache is not None and cache_key in cache:
+                    return cache[cache_key]
+
+                value = self._get_resource(reference, getattr(me, prop_name, 0))
+                if cache is not None and self.is_manager_loaded(reference):
+                    cache[cache_key] = value
+
+                return value
+
+            return property(prop_getter)
+
         def __call__(self, cls):
             factory = getattr(cls, 'FACTORY_TYPE', None)
 
@@ -119,10 +179,8 @@ class EnumItemFactory(TunableSingletonFactory):
                     tunables[new_key] = self.create_tunable(cls, old_key)
                     reference = tunables.pop(old_key)
 
-                    def prop_getter(me, tunable_reference: TunableReference, prop_name: str):
-                        return self._get_resource(tunable_reference, getattr(me, prop_name, 0))
-
-                    setattr(factory, old_key, property(lambda me: prop_getter(me, reference, prop_key)))
+                    self._track_manager(reference)
+                    setattr(factory, old_key, self._create_property(reference, prop_key, f'_resolved_{old_key}'))
 
             setattr(cls, 'FACTORY_TYPE', factory)
             return cls
@@ -234,6 +292,50 @@ class DynamicFactoryEnumMetaclass(enum.Metaclass):
                 else:
                     cls._add_new_enum_value(enum_name, raw_value, factory_value)
 
+        cls.refresh_attribute_table()
+        cls.refresh_reverse_indexes()
+        cls.on_finalize()
+
+    def refresh_attribute_table(cls):
+        attribute_names = getattr(cls.factory_cls, 'FLATTENED_ATTRIBUTES', tuple())
+        tuned_values = getattr(cls, '_tuned_values_mapping', dict())
+        table = {name: dict() for name in attribute_names}
+
+        for member in cls:
+            factory_value = tuned_values.get(member.name, None)
+            if factory_value is None:
+                continue
+
+            for name in attribute_names:
+                table[name][member] = getattr(factory_value, name)
+
+        with cls.make_mutable():
+            cls._attribute_table = table
+            for (name, values) in table.items():
+                setattr(cls, name, _create_flattened_property(name, values))
+
+    def refresh_reverse_indexes(cls):
+        index_names = getattr(cls.factory_cls, 'REVERSE_INDEXES', dict())
+        tuned_values = getattr(cls, '_tuned_values_mapping', dict())
+        indexes = {index_name: dict() for index_name in index_names}
+        indexes['value'] = {member.value: member for member in cls}
+
+        for member in cls:
+            factory_value = tuned_values.get(member.name, None)
+            if factory_value is None:
+                continue
+
+            for (index_name, attribute_name) in index_names.items():
+                key = getattr(factory_value, attribute_name, None)
+                if key:
+                    indexes[index_name].setdefault(key, member)
+
+        with cls.make_mutable():
+            cls._reverse_indexes = indexes
+
+    def get_by_reverse_index(cls, index_name: str, key, default=None):
+        return cls._reverse_indexes.get(index_name, dict()).get(key, default)
+
     @property
     def factory_values(cls):
         return tuple(cls._tuned_values_mapping)
@@ -3,11 +3,13 @@
 #######################################################################################################################
 
 # python imports
-from typing import Dict, Any, Set
+from collections import namedtuple
+from difflib import SequenceMatcher
+from typing import Dict, Any, Tuple, Iterable
 
 # misc imports
 import enum
-from services import get_instance_manager
+from services import get_instance_manager, current_region
 from singletons import DEFAULT
 
 # sims 4 imports
@@ -28,7 +30,7 @@ from filters.tunable import LivesInRegion
 
 # local imports
 from kuttoe_home_regions.enum import DynamicFactoryEnumMetaclass, EnumItemFactory
-from kuttoe_home_regions.utils import construct_auto_init_factory
+from kuttoe_home_regions.utils import construct_auto_init_factory, on_load_complete
 
 
 #######################################################################################################################
@@ -94,6 +96,7 @@ class LocalFixup(AutoFactoryInit, HasTunableFactory):
 
     _ADDITION_MAPPING = dict()
     _REMOVAL_MAPPING = dict()
+    _RESOLVED_ADDITIONS = dict()
 
     @classmethod
     def _collect_traits_to_remove(cls, region_id):
@@ -103,11 +106,12 @@ class LocalFixup(AutoFactoryInit, HasTunableFactory):
             if region != region_id:
                 traits_list.update(traits)
 
-        return traits_list
+        return traits_list - set(cls.traits_to_add.get(region_id, ()))
 
     @classmethod
     def register(cls, factory, region_id):
         cls.traits_to_add.setdefault(region_id, factory._traits)
+        cls.clear_resolved_traits()
 
     @classproperty
     def traits_to_add(cls):
@@ -119,14 +123,47 @@ class LocalFixup(AutoFactoryInit, HasTunableFactory):
     @classproperty
     def traits_to_remove(cls):
         from traits.traits import Trait
-        mapping: Dict[RegionData, Set[Trait]] = cls._REMOVAL_MAPPING
+        mapping: Dict[RegionData, Tuple[Trait, ...]] = cls._REMOVAL_MAPPING
 
         return mapping
 
-    def _load_traits(self, traits_list):
+    @staticmethod
+    def _load_traits(traits_list) -> tuple:
         manager = get_instance_manager(Types.TRAIT)
+        traits = (manager.get(get_resource_key(trait_id, Types.TRAIT)) for trait_id in set(traits_list))
+
+        return tuple(trait for trait in traits if trait is not None)
+
+    @classmethod
+    def _resolve_region(cls, region_id):
+        cls._RESOLVED_ADDITIONS[region_id] = cls._load_traits(cls.traits_to_add.get(region_id, ()))
+        cls._REMOVAL_MAPPING[region_id] = cls._load_traits(cls._collect_traits_to_remove(region_id))
 
-        return {manager.get(get_resource_key(trait_id, Types.TRAIT)) for trait_id in traits_list}
+    @classmethod
+    def resolve_traits(cls):
+        cls.clear_resolved_traits()
+
+        for region_id in cls.traits_to_add:
+            cls._resolve_region(region_id)
+
+    @classmethod
+    def clear_resolved_traits(cls):
+        cls._RESOLVED_ADDITIONS.clear()
+        cls._REMOVAL_MAPPING.clear()
+
+    @classmethod
+    def get_traits_to_add(cls, region_id) -> tuple:
+        if region_id not in cls._RESOLVED_ADDITIONS:
+            cls._resolve_region(region_id)
+
+        return cls._RESOLVED_ADDITIONS[region_id]
+
+    @classmethod
+    def get_traits_to_remove(cls, region_id) -> tuple:
+        if region_id not in cls._REMOVAL_MAPPING:
+            cls._resolve_region(region_id)
+
+        return cls._REMOVAL_MAPPING[region_id]
 
     def __init__(self, sim_info, *args, **kwargs):
         from sims.sim_info import SimInfo
@@ -145,19 +182,29 @@ class LocalFixup(AutoFactoryInit, HasTunableFactory):
         trait_tracker: TraitTracker = self.sim_info.trait_tracker
         return trait_tracker
 
+    @classmethod
+    def get_trait_changes_for(cls, trait_tracker, region_id):
+        has_trait = trait_tracker.has_trait
+
+        traits_to_remove = tuple(trait for trait in cls.get_traits_to_remove(region_id) if has_trait(trait))
+        traits_to_add = tuple(trait for trait in cls.get_traits_to_add(region_id) if not has_trait(trait))
+
+        return traits_to_remove, traits_to_add
+
+    def get_trait_changes(self, region_id):
+        return self.get_trait_changes_for(self.trait_tracker, region_id)
+
     def __call__(self, region_id):
         trait_tracker = self.trait_tracker
+        traits_to_remove, traits_to_add = self.get_trait_changes(region_id)
 
-        traits_to_remove = self.traits_to_remove.setdefault(
-            region_id, self._load_traits(self._collect_traits_to_remove(region_id))
-        )
         for trait in traits_to_remove:
             trait_tracker._remove_trait(trait)
-
-        traits_to_add = self._load_traits(self.traits_to_add[region_id])
         for trait in traits_to_add:
             trait_tracker._add_trait(trait)
 
+        return len(traits_to_remove) + len(traits_to_add)
+
 
 class OptionalTunableLocalFixup(OptionalTunable):
     def __init__(self, *args, **kwargs):
@@ -178,6 +225,7 @@ class RegionData:
             pack: Pack = Pack.BASE_GAME,
             icon_mapping=frozendict(),
             local_fixup: LocalFixup = None,
+            aliases=frozenset(),
     ):
         self._region_id = region_id
         self._name = name
@@ -185,6 +233,7 @@ class RegionData:
         self._icon_mapping = icon_mapping
         self._street_for_creation = street_for_creation
         self._local_fixup = local_fixup
+        self._aliases = aliases
 
         if self.local_fixup:
             self.local_fixup.factory.register(self.local_fixup, self._region_id)
@@ -205,7 +254,7 @@ class RegionData:
 
     @property
     def is_available(self) -> bool:
-        return is_available_pack(self.pack)
+        return AvailableWorlds.is_pack_available(self.pack)
 
     @property
     def icon_mapping(self) -> Dict[IconSize, Any]:
@@ -222,6 +271,10 @@ class RegionData:
     def local_fixup(self):
         return self._local_fixup
 
+    @property
+    def aliases(self):
+        return self._aliases
+
     @property
     def has_local_fixup(self):
         return self._local_fixup is not None
@@ -230,7 +283,14 @@ class RegionData:
         if sim_info is None or not self.has_local_fixup:
             return
 
-        self.local_fixup(sim_info)(self.region.guid64)
+        return self.local_fixup(sim_info)(self.region.guid64)
+
+    def has_fixup_mismatch(self, sim_info) -> bool:
+        if sim_info is None or not self.has_local_fixup:
+            return False
+
+        traits_to_remove, traits_to_add = LocalFixup.get_trait_changes_for(sim_info.trait_tracker, self.region.guid64)
+        return bool(traits_to_remove or traits_to_add)
 
 
 @EnumItemFactory.ReprMixin(name='region_name', region_id=None, region=DEFAULT)
@@ -243,8 +303,13 @@ class RegionDataFactory(EnumItemFactory):
         'icon_mapping': IconMapping(),
         'street_for_creation': TunableWorldDescription(pack_safe=True),
         'local_fixup': OptionalTunableLocalFixup(),
+        'aliases': TunableSet(Tunable(tunable_type=str, default='', allow_empty=False)),
     }
     FACTORY_TYPE = RegionData
+    FLATTENED_ATTRIBUTES = (
+        'region_name', 'pack', 'street_for_creation', 'icon_mapping', 'pie_menu_icon', 'local_fixup', 'has_local_fixup',
+    )
+    REVERSE_INDEXES = dict(region_id='_region_id', street_for_creation='street_for_creation')
 
     def __init__(self, *args, **kwargs):
         kwargs.update(self.FACTORY_TUNABLES)
@@ -270,13 +335,53 @@ class HomeWorldIds(enum.Int, metaclass=DynamicFactoryEnumMetaclass, factory_cls=
 
         return OptionalTunable(enum_set) if optional else enum_set
 
+    @classmethod
+    def on_finalize(cls):
+        WorldNameResolver.rebuild(cls)
+
     @classproperty
     def available_worlds(cls):
-        return set(world for world in cls if world.is_available and world is not HomeWorldIds.DEFAULT)
+        return AvailableWorlds.snapshot.worlds
+
+    @classproperty
+    def available_worlds_mask(cls) -> int:
+        return AvailableWorlds.snapshot.mask
+
+    @classproperty
+    def available_worlds_by_region(cls):
+        return AvailableWorlds.snapshot.by_region
 
     @classproperty
     def world_list(cls):
-        return ', '.join(world.name for world in cls.available_worlds)
+        return AvailableWorlds.snapshot.world_list
+
+    @classmethod
+    def from_region_id(cls, region_id: int, default=None):
+        return cls.get_by_reverse_index('region_id', region_id, default)
+
+    @classmethod
+    def from_region(cls, region, default=None):
+        return cls.from_region_id(getattr(region, 'guid64', 0), default)
+
+    @classmethod
+    def from_world_id(cls, world_id: int, default=None):
+        return cls.get_by_reverse_index('value', world_id, default)
+
+    @classmethod
+    def from_street(cls, street, default=None):
+        return cls.get_by_reverse_index('street_for_creation', street, default)
+
+    @classmethod
+    def from_current_zone(cls, default=None):
+        return cls.from_region(current_region(), default)
+
+    @property
+    def is_available(self) -> bool:
+        return AvailableWorlds.is_pack_available(self.pack)
+
+    @property
+    def ordinal(self) -> int:
+        return AvailableWorlds.snapshot.ordinals[self]
 
     @property
     def command_name_base(self):
@@ -307,3 +412,191 @@ class HomeWorldIds(enum.Int, metaclass=DynamicFactoryEnumMetaclass, factory_cls=
         args.update(overrides)
 
         return construct_auto_init_factory(LivesInRegion, **args)
+
+
+#######################################################################################################################
+#  Available Worlds Snapshot                                                                                          #
+#######################################################################################################################
+
+
+AvailableWorldsSnapshot = namedtuple('AvailableWorldsSnapshot', [
+    'worlds', 'mask', 'by_region', 'packs', 'ordinals', 'world_list', 'all_worlds', 'all_mask', 'generation',
+])
+
+
+class AvailableWorlds:
+    _SNAPSHOT: AvailableWorldsSnapshot = None
+    _GENERATION = 0
+
+    @classmethod
+    def _take_snapshot(cls) -> AvailableWorldsSnapshot:
+        cls._GENERATION += 1
+        all_worlds = frozenset(world for world in HomeWorldIds if world is not HomeWorldIds.DEFAULT)
+        packs = frozenset(pack for pack in Pack if is_available_pack(pack))
+        ordinals = frozendict({world: index for (index, world) in enumerate(HomeWorldIds)})
+        worlds = tuple(world for world in HomeWorldIds if world is not HomeWorldIds.DEFAULT and world.pack in packs)
+
+        args = dict()
+        args['worlds'] = worlds
+        args['mask'] = sum(1 << ordinals[world] for world in worlds)
+        args['by_region'] = frozendict({world.region: world for world in worlds if world.region is not None})
+        args['packs'] = packs
+        args['ordinals'] = ordinals
+        args['world_list'] = ', '.join(world.name for world in worlds)
+        args['all_worlds'] = all_worlds
+        args['all_mask'] = sum(1 << ordinals[world] for world in all_worlds)
+        args['generation'] = cls._GENERATION
+
+        return AvailableWorldsSnapshot(**args)
+
+    @classproperty
+    def snapshot(cls) -> AvailableWorldsSnapshot:
+        if cls._SNAPSHOT is None:
+            cls._SNAPSHOT = cls._take_snapshot()
+
+        return cls._SNAPSHOT
+
+    @classmethod
+    def invalidate(cls):
+        cls._SNAPSHOT = None
+
+    @classmethod
+    def is_pack_available(cls, pack: Pack) -> bool:
+        return pack in cls.snapshot.packs
+
+    @classmethod
+    def are_packs_available(cls, packs: Iterable[Pack]) -> bool:
+        return cls.snapshot.packs.issuperset(packs)
+
+    @classmethod
+    def is_world_available(cls, world: HomeWorldIds) -> bool:
+        snapshot = cls.snapshot
+
+        return bool(snapshot.mask >> snapshot.ordinals[world] & 1)
+
+    @classmethod
+    def get_worlds_mask(cls, worlds: Iterable[HomeWorldIds]) -> int:
+        ordinals = cls.snapshot.ordinals
+
+        return sum(1 << ordinals[world] for world in set(worlds))
+
+
+#######################################################################################################################
+#  World Name Resolution                                                                                              #
+#######################################################################################################################
+
+
+class WorldNameMatchType(enum.Int):
+    NONE = 0
+    EXACT = 1
+    ALIAS = 2
+    PREFIX = 3
+    MISSPELLING = 4
+
+
+WorldNameResolution = namedtuple('WorldNameResolution', ['world', 'match_type', 'suggestions'])
+
+
+class WorldNameResolver:
+    MAX_SUGGESTIONS = 5
+    _NAMES: Dict[str, HomeWorldIds] = dict()
+    _ALIASES: Dict[str, HomeWorldIds] = dict()
+    _PREFIXES: Dict[str, frozenset] = dict()
+    _DELETIONS: Dict[str, frozenset] = dict()
+
+    @staticmethod
+    def normalise(*name_parts: str) -> str:
+        return ''.join(character for character in ''.join(name_parts).upper() if character.isalnum())
+
+    @staticmethod
+    def _get_deletions(key: str):
+        return {key[:index] + key[index + 1:] for index in range(len(key))}
+
+    @classmethod
+    def rebuild(cls, enum_cls=HomeWorldIds):
+        names, aliases, prefixes, deletions = dict(), dict(), dict(), dict()
+
+        for world in enum_cls:
+            names[cls.normalise(world.name)] = world
+            if world is enum_cls.DEFAULT:
+                continue
+
+            for alias in getattr(world.factory_value, 'aliases', ()):
+                aliases.setdefault(cls.normalise(alias), world)
+
+        for (key, world) in (*aliases.items(), *names.items()):
+            if world is enum_cls.DEFAULT:
+                continue
+
+            for index in range(1, len(key) + 1):
+                prefixes.setdefault(key[:index], set()).add(world)
+            for deletion in cls._get_deletions(key):
+                deletions.setdefault(deletion, set()).add(world)
+
+        cls._NAMES = names
+        cls._ALIASES = aliases
+        cls._PREFIXES = {prefix: frozenset(worlds) for (prefix, worlds) in prefixes.items()}
+        cls._DELETIONS = {deletion: frozenset(worlds) for (deletion, worlds) in deletions.items()}
+
+    @classmethod
+    def _get_misspelling_candidates(cls, key: str) -> set:
+        candidates = set(cls._DELETIONS.get(key, ()))
+
+        for deletion in cls._get_deletions(key):
+            for table in (cls._NAMES, cls._ALIASES):
+                if deletion in table:
+                    candidates.add(table[deletion])
+            candidates.update(cls._DELETIONS.get(deletion, ()))
+
+        return candidates
+
+    @classmethod
+    def _get_prefix_candidates(cls, key: str) -> frozenset:
+        for length in range(len(key), 0, -1):
+            candidates = cls._PREFIXES.get(key[:length], None)
+            if candidates:
+                return candidates
+
+        return frozenset()
+
+    @classmethod
+    def get_suggestions(cls, key: str, *candidate_sets) -> tuple:
+        candidates = set().union(*candidate_sets) if candidate_sets else set()
+        if not candidates:
+            candidates = cls._get_misspelling_candidates(key) | cls._get_prefix_candidates(key)
+
+        def _score(world):
+            return SequenceMatcher(None, key, cls.normalise(world.name)).ratio()
+
+        return tuple(sorted(candidates, key=lambda world: (-_score(world), world.name))[:cls.MAX_SUGGESTIONS])
+
+    @classmethod
+    def resolve(cls, *name_parts: str) -> WorldNameResolution:
+        key = cls.normalise(*name_parts)
+
+        if key in cls._NAMES:
+            return WorldNameResolution(cls._NAMES[key], WorldNameMatchType.EXACT, tuple())
+        if key in cls._ALIASES:
+            return WorldNameResolution(cls._ALIASES[key], WorldNameMatchType.ALIAS, tuple())
+
+        prefix_matches = cls._PREFIXES.get(key, frozenset())
+        if len(prefix_matches) == 1:
+            return WorldNameResolution(next(iter(prefix_matches)), WorldNameMatchType.PREFIX, tuple())
+
+        misspellings = cls._get_misspelling_candidates(key) if key else set()
+        if len(misspellings) == 1:
+            return WorldNameResolution(next(iter(misspellings)), WorldNameMatchType.MISSPELLING, tuple())
+
+        suggestions = cls.get_suggestions(key, prefix_matches, misspellings)
+        return WorldNameResolution(None, WorldNameMatchType.NONE, suggestions)
+
+
+#######################################################################################################################
+#  Tuning Load Hooks                                                                                                  #
+#######################################################################################################################
+
+
+@on_load_complete(Types.TUNING)
+def _refresh_home_world_attributes(_):
+    AvailableWorlds.invalidate()
+    LocalFixup.resolve_traits()
@@ -0,0 +1,248 @@
+#######################################################################################################################
+#  Imports                                                                                                            #
+#######################################################################################################################
+
+# python imports
+from bisect import bisect_left, insort
+from collections import namedtuple
+from typing import Dict, Set, List, Tuple
+
+# miscellaneous
+import enum
+import services
+from indexed_manager import CallbackTypes
+
+# sim imports
+from sims.sim_info_manager import SimInfoManager
+
+
+#######################################################################################################################
+#  Enumerations                                                                                                       #
+#######################################################################################################################
+
+
+class NameMatchType(enum.Int):
+    NONE = 0
+    EXACT = 1
+    PREFIX = 2
+    PARTIAL = 3
+
+
+#######################################################################################################################
+#  Named Tuples                                                                                                       #
+#######################################################################################################################
+
+
+NameMatch = namedtuple('NameMatch', ['sim_infos', 'match_type'])
+
+
+#######################################################################################################################
+#  Sim Info Index                                                                                                     #
+#######################################################################################################################
+
+
+class _SimInfoIndex:
+    _INSTANCE = None
+
+    @classmethod
+    def get(cls):
+        manager: SimInfoManager = services.sim_info_manager()
+
+        if cls._INSTANCE is None or cls._INSTANCE.manager is not manager:
+            if cls._INSTANCE is not None:
+                cls._INSTANCE.detach()
+            cls._INSTANCE = cls(manager)
+
+        return cls._INSTANCE
+
+    def __init__(self, manager: SimInfoManager):
+        self._manager = manager
+        self._is_built = False
+
+    @property
+    def manager(self):
+        return self._manager
+
+    def _add(self, sim_info):
+        raise NotImplementedError
+
+    def _remove(self, sim_id: int):
+        raise NotImplementedError
+
+    def _on_sim_info_added(self, sim_info):
+        if self._is_built:
+            self._add(sim_info)
+
+    def _on_sim_info_removed(self, sim_info):
+        if self._is_built:
+            self._remove(sim_info.id)
+
+    def _build(self):
+        if self._is_built:
+            return
+
+        for sim_info in self.manager.get_all():
+            self._add(sim_info)
+
+        self.manager.register_callback(CallbackTypes.ON_OBJECT_ADD, self._on_sim_info_added)
+        self.manager.register_callback(CallbackTypes.ON_OBJECT_REMOVE, self._on_sim_info_removed)
+        self._is_built = True
+
+    def detach(self):
+        if not self._is_built:
+            return
+
+        self.manager.unregister_callback(CallbackTypes.ON_OBJECT_ADD, self._on_sim_info_added)
+        self.manager.unregister_callback(CallbackTypes.ON_OBJECT_REMOVE, self._on_sim_info_removed)
+        self._is_built = False
+
+
+#######################################################################################################################
+#  Sim Name Index                                                                                                     #
+#######################################################################################################################
+
+
+class SimNameIndex(_SimInfoIndex):
+    @staticmethod
+    def normalise(*name_parts: str) -> str:
+        return ' '.join(part.strip() for part in name_parts if part and part.strip()).casefold()
+
+    def __init__(self, manager: SimInfoManager):
+        super().__init__(manager)
+        self._sim_ids_by_name: Dict[str, Set[int]] = dict()
+        self._names_by_sim_id: Dict[int, str] = dict()
+        self._sorted_names: List[str] = list()
+
+    def __len__(self):
+        self._build()
+
+        return len(self._names_by_sim_id)
+
+    def _add(self, sim_info):
+        name = self.normalise(sim_info.first_name, sim_info.last_name)
+        if self._names_by_sim_id.get(sim_info.id, None) == name:
+            return
+
+        self._remove(sim_info.id)
+        self._names_by_sim_id[sim_info.id] = name
+
+        sim_ids = self._sim_ids_by_name.setdefault(name, set())
+        if not sim_ids:
+            insort(self._sorted_names, name)
+        sim_ids.add(sim_info.id)
+
+    def _remove(self, sim_id: int):
+        name = self._names_by_sim_id.pop(sim_id, None)
+        if name is None:
+            return
+
+        sim_ids = self._sim_ids_by_name.get(name, set())
+        sim_ids.discard(sim_id)
+        if not sim_ids:
+            del self._sim_ids_by_name[name]
+            del self._sorted_names[bisect_left(self._sorted_names, name)]
+
+    def _get_sim_infos(self, names) -> Tuple:
+        sim_infos = (
+            self.manager.get(sim_id)
+            for name in names
+            for sim_id in sorted(self._sim_ids_by_name.get(name, ()))
+        )
+
+        return tuple(sim_info for sim_info in sim_infos if sim_info is not None)
+
+    def _get_prefixed_names(self, prefix: str):
+        index = bisect_left(self._sorted_names, prefix)
+
+        while index < len(self._sorted_names) and self._sorted_names[index].startswith(prefix):
+            yield self._sorted_names[index]
+            index += 1
+
+    def _get_partial_names(self, *name_parts: str):
+        parts = tuple(self.normalise(part) for part in name_parts if self.normalise(part))
+
+        return tuple(name for name in self._sorted_names if all(part in name for part in parts))
+
+    def find_exact(self, first_name: str, last_name: str = '') -> Tuple:
+        self._build()
+
+        return self._get_sim_infos((self.normalise(first_name, last_name), ))
+
+    def find_prefix(self, first_name: str, last_name: str = '') -> Tuple:
+        self._build()
+
+        return self._get_sim_infos(tuple(self._get_prefixed_names(self.normalise(first_name, last_name))))
+
+    def find_partial(self, first_name: str, last_name: str = '') -> Tuple:
+        self._build()
+
+        return self._get_sim_infos(self._get_partial_names(first_name, last_name))
+
+    def find(self, first_name: str, last_name: str = '') -> NameMatch:
+        finders = (
+            (NameMatchType.EXACT, self.find_exact),
+            (NameMatchType.PREFIX, self.find_prefix),
+            (NameMatchType.PARTIAL, self.find_partial),
+        )
+
+        for (match_type, finder) in finders:
+            sim_infos = finder(first_name, last_name)
+            if sim_infos:
+                return NameMatch(sim_infos, match_type)
+
+        return NameMatch(tuple(), NameMatchType.NONE)
+
+
+#######################################################################################################################
+#  Home World Sim Index                                                                                               #
+#######################################################################################################################
+
+
+class HomeWorldSimIndex(_SimInfoIndex):
+    @classmethod
+    def notify_household_changed(cls, household):
+        if cls._INSTANCE is not None and household is not None:
+            cls._INSTANCE.update_household(household)
+
+    @staticmethod
+    def get_world_id(sim_info):
+        return getattr(getattr(sim_info, 'household', None), '_home_world_id', None)
+
+    def __init__(self, manager: SimInfoManager):
+        super().__init__(manager)
+        self._sim_ids_by_world: Dict[int, Set[int]] = dict()
+        self._world_by_sim_id: Dict[int, int] = dict()
+
+    def _add(self, sim_info):
+        world_id = self.get_world_id(sim_info)
+        if world_id is None:
+            self._remove(sim_info.id)
+            return
+        if self._world_by_sim_id.get(sim_info.id, None) == world_id:
+            return
+
+        self._remove(sim_info.id)
+        self._world_by_sim_id[sim_info.id] = world_id
+        self._sim_ids_by_world.setdefault(world_id, set()).add(sim_info.id)
+
+    def _remove(self, sim_id: int):
+        if sim_id not in self._world_by_sim_id:
+            return
+
+        world_id = self._world_by_sim_id.pop(sim_id)
+        sim_ids = self._sim_ids_by_world.get(world_id, set())
+        sim_ids.discard(sim_id)
+        if not sim_ids:
+            self._sim_ids_by_world.pop(world_id, None)
+
+    def update_household(self, household):
+        if self._is_built:
+            for sim_info in household.sim_info_gen():
+                self._add(sim_info)
+
+    def is_in_world(self, sim_info, world_id: int) -> bool:
+        self._build()
+        if sim_info.id not in self._world_by_sim_id or self._world_by_sim_id[sim_info.id] == world_id:
+            self._add(sim_info)
+
+        return self._world_by_sim_id.get(sim_info.id, None) == world_id
@@ -1,9 +1,11 @@
 #######################################################################################################################
 #  Imports                                                                                                            #
 #######################################################################################################################
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from sys import getsizeof, modules
+from time import perf_counter
 from itertools import chain
-from typing import Dict
+from typing import Dict, Set, Callable, List, Tuple, Any
 
 # sims4 imports
 from sims4.utils import classproperty, constproperty
@@ -13,6 +15,7 @@ from sims4.collections import frozendict
 from sims4.tuning.tunable import TunableSet, TunableMapping, TunablePackSafeReference, TunableEnumEntry
 from sims4.tuning.tunable import TunableVariant, HasTunableFactory, AutoFactoryInit, TunableInterval, TunableList
 from sims4.tuning.tunable import TunableEnumWithFilter, TunableTuple, Tunable, OptionalTunable
+from sims4.tuning.tunable_base import TunableBase
 
 # venue imports
 from venues.npc_summoning import ResidentialLotArrivalBehavior, CreateAndAddToSituation, AddToBackgroundSituation,\
@@ -35,7 +38,101 @@ from services import get_instance_manager
 from singletons import DEFAULT
 
 # local imports
-from kuttoe_home_regions.utils import on_load_complete
+from kuttoe_home_regions.utils import on_load_complete, clear_auto_init_factory_info, ClassFactoryCache
+
+
+#######################################################################################################################
+#  Reversible Injections                                                                                              #
+#######################################################################################################################
+
+
+class InjectionJournal:
+    __slots__ = ('_originals', )
+
+    def __init__(self):
+        self._originals: Dict[Tuple[int, str], Tuple[Any, str, Any, bool]] = OrderedDict()
+
+    def __len__(self):
+        return len(self._originals)
+
+    @staticmethod
+    def _owns_attribute(obj, attr_name: str) -> bool:
+        return not hasattr(obj, '__dict__') or attr_name in vars(obj)
+
+    def set(self, obj, attr_name: str, value):
+        key = (id(obj), attr_name)
+
+        if key not in self._originals:
+            self._originals[key] = (obj, attr_name, getattr(obj, attr_name), self._owns_attribute(obj, attr_name))
+        setattr(obj, attr_name, value)
+
+    def extend(self, obj, attr_name: str, *values):
+        self.set(obj, attr_name, getattr(obj, attr_name) + values)
+
+    def undo(self) -> int:
+        count = len(self._originals)
+
+        for (obj, attr_name, value, owned) in reversed(tuple(self._originals.values())):
+            if owned:
+                setattr(obj, attr_name, value)
+            else:
+                delattr(obj, attr_name)
+        self._originals.clear()
+
+        return count
+
+
+class InjectionLayer:
+    _JOURNAL = InjectionJournal()
+    _INJECTORS: List[Callable] = list()
+    _TUNABLES: Dict[type, Dict[str, TunableBase]] = dict()
+
+    @classproperty
+    def journal(cls) -> InjectionJournal:
+        return cls._JOURNAL
+
+    @classmethod
+    def register(cls, injector: Callable):
+        cls._INJECTORS.append(injector)
+
+        return injector
+
+    @classmethod
+    def track_tunables(cls, *tuning_classes):
+        for tuning_class in tuning_classes:
+            tunables = {name: value for (name, value) in vars(tuning_class).items() if isinstance(value, TunableBase)}
+            cls._TUNABLES[tuning_class] = tunables
+
+    @classmethod
+    def apply_all(cls):
+        tuning_manager = get_instance_manager(Types.TUNING)
+
+        for injector in cls._INJECTORS:
+            injector(tuning_manager)
+
+    @classmethod
+    def undo_all(cls) -> int:
+        return cls._JOURNAL.undo()
+
+    @classmethod
+    def reload_tuning(cls) -> bool:
+        from sims4.tuning.serialization import load_module_tuning
+
+        for (tuning_class, tunables) in cls._TUNABLES.items():
+            for (name, tunable) in tunables.items():
+                setattr(tuning_class, name, tunable)
+
+        return load_module_tuning(modules[__name__], __name__.replace('.', '-'))
+
+    @classmethod
+    def reload(cls) -> Tuple[int, int]:
+        undone = cls.undo_all()
+        cls.reload_tuning()
+        clear_auto_init_factory_info()
+        ClassFactoryCache.clear('tuning_class')
+        cls.apply_all()
+
+        return undone, len(cls._JOURNAL)
 
 
 #######################################################################################################################
@@ -74,13 +171,14 @@ class VenueModifications:
 
     @staticmethod
     @on_load_complete(Types.TUNING, safe=False)
+    @InjectionLayer.register
     def _modify_venues(tuning_manager):
         cls = VenueModifications
 
         for venue in cls.venues:
             npc_summoning_behaviour = dict(venue.npc_summoning_behavior)
             npc_summoning_behaviour[NPCSummoningPurpose.Invite_Over] = cls.INVITE_OVER_OVERRIDES
-            venue.npc_summoning_behavior = frozendict(npc_summoning_behaviour)
+            InjectionLayer.journal.set(venue, 'npc_summoning_behavior', frozendict(npc_summoning_behaviour))
 
 
 #######################################################################################################################
@@ -114,7 +212,7 @@ class SituationJobTemplate(HasTunableFactory, AutoFactoryInit):
         tunables = (tunables, ) if isinstance(tunables, str) else tunables
         props_list = list(self.FACTORY_TUNABLES.keys()) if tunables is DEFAULT else tunables
         for prop in props_list:
-            setattr(self._situation_job, prop, getattr(self, prop))
+            InjectionLayer.journal.set(self._situation_job, prop, getattr(self, prop))
 
 
 class FilterToSituationJobMapping(TunableMapping):
@@ -133,6 +231,139 @@ class BypassListType(enum.Int):
     SOFT = 2
 
 
+class BypassReason(enum.IntFlags):
+    NONE = 0
+    BYPASS_LIST = 1
+    BYPASS_TAGS = 2
+    FORCE_INVITE_ONLY = 4
+    IMPLIES_GREETED_STATUS = 8
+    HIGH_SCHOOL = 16
+    FILTERS_TO_BYPASS = 32
+
+    @classmethod
+    def decompose(cls, mask: int):
+        return tuple(reason for reason in cls if reason and mask & reason)
+
+    @classmethod
+    def describe(cls, mask: int) -> str:
+        return ' | '.join(reason.name for reason in cls.decompose(mask)) or cls.NONE.name
+
+
+class BypassReasonIndex:
+    __slots__ = ('_reasons', '_jobs', '_names', '_buckets')
+
+    def __init__(self):
+        self._reasons: Dict[int, int] = dict()
+        self._jobs: Dict[int, SituationJob] = dict()
+        self._names: Dict[str, int] = dict()
+        self._buckets: Dict[BypassReason, Set[int]] = {reason: set() for reason in BypassReason if reason}
+
+    def __len__(self):
+        return len(self._reasons)
+
+    def __contains__(self, situation_job):
+        return getattr(situation_job, 'guid64', None) in self._reasons
+
+    def __iter__(self):
+        return iter(self._jobs.values())
+
+    def clear(self):
+        self._reasons.clear()
+        self._jobs.clear()
+        self._names.clear()
+        for bucket in self._buckets.values():
+            bucket.clear()
+
+    def add(self, situation_job, reason: BypassReason):
+        if situation_job is None or not reason:
+            return
+
+        guid = situation_job.guid64
+        self._reasons[guid] = self._reasons.get(guid, BypassReason.NONE) | reason
+        self._jobs[guid] = situation_job
+        self._names[situation_job.__name__.lower()] = guid
+        for flag in BypassReason.decompose(reason):
+            self._buckets[flag].add(guid)
+
+    def update(self, situation_jobs, reason: BypassReason):
+        for situation_job in situation_jobs:
+            self.add(situation_job, reason)
+
+    def get_reasons(self, situation_job) -> int:
+        return self._reasons.get(getattr(situation_job, 'guid64', None), BypassReason.NONE)
+
+    def get_reasons_by_guid(self, guid: int) -> int:
+        return self._reasons.get(guid, BypassReason.NONE)
+
+    def get_job_by_name(self, name: str):
+        return self._jobs.get(self._names.get(name.lower()), None)
+
+    def iter_jobs(self, reasons: int = DEFAULT):
+        if reasons is DEFAULT:
+            yield from self._reasons.items()
+            return
+
+        guids = set()
+        for flag in BypassReason.decompose(reasons):
+            guids.update(self._buckets[flag])
+
+        for guid in guids:
+            yield guid, self._reasons[guid]
+
+    def iter_items(self, reasons: int = DEFAULT):
+        for (guid, mask) in self.iter_jobs(reasons):
+            yield self._jobs[guid], mask
+
+
+class SituationJobIndex:
+    __slots__ = ('_usages', '_job_reasons', '_situation_reasons', '_names')
+
+    def __init__(self):
+        self._usages: Dict[SituationJob, List[Tuple[Any, int]]] = defaultdict(list)
+        self._job_reasons: Dict[SituationJob, int] = dict()
+        self._situation_reasons: Dict[Any, int] = dict()
+        self._names: Dict[str, SituationJob] = dict()
+
+    def __len__(self):
+        return len(self._usages)
+
+    def clear(self):
+        self._usages.clear()
+        self._job_reasons.clear()
+        self._situation_reasons.clear()
+        self._names.clear()
+
+    def add_situation(self, situation, reason: BypassReason = BypassReason.NONE):
+        self._situation_reasons[situation] = reason
+
+        for (phase_index, phase) in enumerate(getattr(situation, '_phases', tuple())):
+            for job in phase._job_list.keys():
+                if job is None:
+                    continue
+
+                self._usages[job].append((situation, phase_index))
+                if reason:
+                    self._job_reasons[job] = self._job_reasons.get(job, BypassReason.NONE) | reason
+
+    def add_job(self, situation_job):
+        self._names[situation_job.__name__.lower()] = situation_job
+
+    def get_job_by_name(self, name: str):
+        return self._names.get(name.lower(), None)
+
+    def get_usages(self, situation_job) -> Tuple[Tuple[Any, int], ...]:
+        return tuple(self._usages.get(situation_job, tuple()))
+
+    def get_situations(self, situation_job) -> Set[Any]:
+        return {situation for (situation, _) in self._usages.get(situation_job, tuple())}
+
+    def get_reasons(self, situation_job) -> int:
+        return self._job_reasons.get(situation_job, BypassReason.NONE)
+
+    def get_situation_reasons(self, situation) -> int:
+        return self._situation_reasons.get(situation, BypassReason.NONE)
+
+
 class HighSchoolSituationBypassMapping(TunableMapping):
     def __init__(self, *args, **kwargs):
         kwargs['key_name'] = 'job'
@@ -230,7 +461,8 @@ class SituationJobModifications:
     BYPASS_TAGS = TunableSet(tunable=TunableEnumWithFilter(tunable_type=Tag, filter_prefixes=['situation'],
                                                            default=Tag.INVALID, pack_safe=True))
     HIGH_SCHOOL_SITUATION_JOBS_INFO = HighSchoolSituationJobsInfo.TunableFactory()
-    _BYPASSED_JOBS = set()
+    _BYPASS_INDEX = BypassReasonIndex()
+    _JOB_INDEX = SituationJobIndex()
 
     @classproperty
     def high_school_situation_jobs_info(cls) -> set:
@@ -244,11 +476,25 @@ class SituationJobModifications:
 
         return primary_list | cls.high_school_situation_jobs_info.softly_bypassed_jobs
 
+    @classproperty
+    def primary_bypass_list(cls):
+        return {situation_job for situation_job in cls.BYPASS_LIST if situation_job is not None}
+
+    @classproperty
+    def high_school_bypass_list(cls):
+        return cls.high_school_situation_jobs_info()
+
     @classproperty
     def bypass_list(cls):
-        primary_list = {situation_job for situation_job in cls.BYPASS_LIST if situation_job is not None}
+        return cls.primary_bypass_list | cls.high_school_bypass_list
 
-        return primary_list | cls.high_school_situation_jobs_info()
+    @classproperty
+    def bypass_index(cls) -> BypassReasonIndex:
+        return cls._BYPASS_INDEX
+
+    @classproperty
+    def job_index(cls) -> SituationJobIndex:
+        return cls._JOB_INDEX
 
     @classproperty
     def second_chance_list(cls):
@@ -261,7 +507,7 @@ class SituationJobModifications:
     @classmethod
     def _inject_soft_filter(cls):
         for situation in cls.soft_list:
-            situation.location_based_filter_terms += (cls.SOFT_FILTER, )
+            InjectionLayer.journal.extend(situation, 'location_based_filter_terms', cls.SOFT_FILTER)
 
     @classmethod
     def _inject_force_replacement(cls):
@@ -276,7 +522,7 @@ class SituationJobModifications:
 
             for situation in situation_jobs:
                 if situation:
-                    situation.filter = new_filter
+                    InjectionLayer.journal.set(situation, 'filter', new_filter)
 
     @classmethod
     def _fixup_filters_for_situation_jobs(cls):
@@ -289,45 +535,59 @@ class SituationJobModifications:
                     continue
 
                 cls.TEMPLATE(situation_job).replace_tunables()
-                situation_job.filter = new_filter
+                InjectionLayer.journal.set(situation_job, 'filter', new_filter)
 
     @classmethod
-    def _add_jobs_to_bypass_list(cls, situation):
-        phases = getattr(situation, '_phases', tuple())
+    def get_situation_bypass_reason(cls, situation) -> BypassReason:
+        tags = getattr(situation, 'tags', set())
+        reason = BypassReason.NONE
 
-        for phase in phases:
-            jobs = phase._job_list.keys()
-            cls._BYPASSED_JOBS.update(job for job in jobs if job is not None and job not in cls.second_chance_list)
+        if situation.force_invite_only:
+            reason |= BypassReason.FORCE_INVITE_ONLY
+        if situation._implies_greeted_status:
+            reason |= BypassReason.IMPLIES_GREETED_STATUS
+        if tags & cls.BYPASS_TAGS:
+            reason |= BypassReason.BYPASS_TAGS
 
-    @classmethod
-    def check_situation(cls, situation):
-        tags = getattr(situation, 'tags', set())
-        should_bypass = list()
+        return reason
 
-        should_bypass.append(situation.force_invite_only or situation._implies_greeted_status)
-        should_bypass.append(tags & cls.BYPASS_TAGS)
+    @classmethod
+    def _build_job_index(cls):
+        cls._JOB_INDEX.clear()
 
-        if any(should_bypass):
-            cls._add_jobs_to_bypass_list(situation)
+        situation_manager: InstanceManager = get_instance_manager(Types.SITUATION)
+        for situation in situation_manager.types.values():
+            cls._JOB_INDEX.add_situation(situation, cls.get_situation_bypass_reason(situation))
 
     @classmethod
     def _inject_into_situation_jobs(cls):
-        cls._BYPASSED_JOBS.update(cls.bypass_list)
+        bypass_index = cls._BYPASS_INDEX
+        job_index = cls._JOB_INDEX
 
-        situation_manager: InstanceManager = get_instance_manager(Types.SITUATION)
-        for situation in situation_manager.get_ordered_types():
-            cls.check_situation(situation)
+        bypass_index.clear()
+        bypass_index.update(cls.primary_bypass_list, BypassReason.BYPASS_LIST)
+        bypass_index.update(cls.high_school_bypass_list, BypassReason.HIGH_SCHOOL)
+        cls._build_job_index()
 
+        second_chance_list = cls.second_chance_list
+        filters_to_bypass = frozenset(cls.FILTERS_TO_BYPASS)
         situation_jobs_manager: InstanceManager = get_instance_manager(Types.SITUATION_JOB)
-        for situation_job in situation_jobs_manager.get_ordered_types():
+        for situation_job in situation_jobs_manager.types.values():
+            job_index.add_job(situation_job)
+            if situation_job not in second_chance_list:
+                bypass_index.add(situation_job, job_index.get_reasons(situation_job))
+
             if not hasattr(situation_job, 'location_based_filter_terms'):
                 continue
 
-            if situation_job not in cls._BYPASSED_JOBS and situation_job.filter not in cls.FILTERS_TO_BYPASS:
-                situation_job.location_based_filter_terms += (cls.MAIN_FILTER, )
+            if situation_job.filter in filters_to_bypass:
+                bypass_index.add(situation_job, BypassReason.FILTERS_TO_BYPASS)
+            elif situation_job not in bypass_index:
+                InjectionLayer.journal.extend(situation_job, 'location_based_filter_terms', cls.MAIN_FILTER)
 
     @staticmethod
     @on_load_complete(Types.TUNING, safe=False)
+    @InjectionLayer.register
     def _do_injections(tuning_manager):
         cls = SituationJobModifications
 
@@ -405,10 +665,10 @@ class AggregateFilterOverrides(HasTunableFactory, AutoFactoryInit):
         if self.replacement_policy == ReplacementPolicy.COMBINE:
             filters.extend(self.sim_filter.filters)
         filters.extend(self.filters.filters_list)
-        self.sim_filter.filters = tuple(filters)
+        InjectionLayer.journal.set(self.sim_filter, 'filters', tuple(filters))
 
         if self.leader_filter:
-            self.sim_filter.leader_filter = self.leader_filter
+            InjectionLayer.journal.set(self.sim_filter, 'leader_filter', self.leader_filter)
 
         return True
 
@@ -426,22 +686,72 @@ class TunableAggregateFilterOverrides(TunableMapping):
 class FilterModifications:
     ADD_REGION_TEST_LIST = TunableSet(tunable=TunableSimFilter.TunablePackSafeReference())
     AGGREGATE_FILTER_OVERRIDES = TunableAggregateFilterOverrides()
+    _LIVES_IN_REGION_TERM = None
+    _LIVES_IN_REGION_CONSTRUCTION_MS = 0.0
 
-    @classproperty
-    def lives_in_region_test(cls):
+    @staticmethod
+    def _create_lives_in_region_test():
         return LivesInRegion(force_filter_term=True, invert_score=False, minimum_filter_score=0.0, region=None,
                              street_for_creation=None)
 
+    @classproperty
+    def lives_in_region_test(cls):
+        if cls._LIVES_IN_REGION_TERM is None:
+            start_time = perf_counter()
+            cls._LIVES_IN_REGION_TERM = cls._create_lives_in_region_test()
+            cls._LIVES_IN_REGION_CONSTRUCTION_MS = (perf_counter() - start_time) * 1000
+
+        return cls._LIVES_IN_REGION_TERM
+
     @classproperty
     def add_region_filters_list(cls):
         return {sim_filter for sim_filter in cls.ADD_REGION_TEST_LIST if sim_filter is not None}
 
+    @staticmethod
+    def _get_shallow_term_size(filter_term) -> int:
+        return getsizeof(filter_term) + getsizeof(getattr(filter_term, '__dict__', None))
+
+    @classmethod
+    def apply_filter_term(cls, filter_term, sim_filters) -> int:
+        applied = 0
+
+        for sim_filter in sim_filters:
+            if any(term is filter_term for term in sim_filter._filter_terms):
+                continue
+
+            InjectionLayer.journal.extend(sim_filter, '_filter_terms', filter_term)
+            applied += 1
+
+        return applied
+
+    @classmethod
+    def _report_shared_term(cls, applied: int, elapsed_ms: float):
+        from kuttoe_home_regions.profiling import StartupProfiler
+
+        instances_saved = max(applied - 1, 0)
+
+        StartupProfiler.record(
+            'FilterModifications.lives_in_region_test',
+            filters=applied,
+            elapsed_ms=round(elapsed_ms, 3),
+            instances_saved=instances_saved,
+            shallow_bytes_saved=instances_saved * cls._get_shallow_term_size(cls.lives_in_region_test),
+            construction_ms=round(cls._LIVES_IN_REGION_CONSTRUCTION_MS, 3),
+            estimated_time_saved_ms=round(instances_saved * cls._LIVES_IN_REGION_CONSTRUCTION_MS, 3),
+        )
+
     @staticmethod
     @on_load_complete(Types.TUNING, safe=False)
+    @InjectionLayer.register
     def _inject_into_filters(tuning_manager):
         cls = FilterModifications
 
         for (sim_filter, overrides) in cls.AGGREGATE_FILTER_OVERRIDES.items():
             overrides(sim_filter)()
-        for sim_filter in cls.add_region_filters_list:
-            sim_filter._filter_terms += (cls.lives_in_region_test, )
+
+        start_time = perf_counter()
+        applied = cls.apply_filter_term(cls.lives_in_region_test, cls.add_region_filters_list)
+        cls._report_shared_term(applied, (perf_counter() - start_time) * 1000)
+
+
+InjectionLayer.track_tunables(VenueModifications, SituationJobModifications, FilterModifications)
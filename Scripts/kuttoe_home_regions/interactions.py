@@ -2,6 +2,9 @@
 #  Imports                                                                                                            #
 #######################################################################################################################
 
+# python imports
+from collections import defaultdict
+
 # miscellaneous
 import services
 
@@ -9,7 +12,6 @@ import services
 from sims4.utils import classproperty
 from sims4.tuning.tunable import OptionalTunable, TunableEnumEntry, Tunable, TunableRange
 from sims4.tuning.instances import lock_instance_tunables
-from sims4.commands import execute as execute_command
 
 # interaction imports
 from interactions.base.immediate_interaction import ImmediateSuperInteraction
@@ -22,7 +24,7 @@ from sims.sim_info_manager import SimInfoManager
 # local imports
 from kuttoe_home_regions.utils import make_do_command, CommandsList
 from kuttoe_home_regions.home_worlds import HomeWorldIds
-from kuttoe_home_regions.commands import AlterType
+from kuttoe_home_regions.commands import AlterType, kuttoe_bulk_set_world_id, kuttoe_settings_bulk_alter_worlds_list
 from kuttoe_home_regions.ui import NotificationType, TunableNotificationSnippet, InteractionType
 
 
@@ -56,6 +58,12 @@ class _DisplayNotificationMixin:
         dialog.show_dialog()
 
 
+class _ClientIdMixin:
+    @classproperty
+    def client_id(cls):
+        return services.client_manager().get_first_client_id()
+
+
 class _TargetHomeWorldMixin:
     INSTANCE_TUNABLES = {
         'target_home_world': TunableEnumEntry(tunable_type=HomeWorldIds, default=HomeWorldIds.DEFAULT)
@@ -76,10 +84,7 @@ class _PieMenuPriorityMixin:
 
     @classproperty
     def pie_menu_priority(cls):
-        current_region = services.current_region()
-        target_region = cls.target_home_world.region
-
-        if target_region is current_region:
+        if HomeWorldIds.from_current_zone() is cls.target_home_world:
             return cls.BUMP_UP_PRIORITY
         else:
             return cls._pie_menu_priority
@@ -90,11 +95,7 @@ class _PieMenuPriorityMixin:
 #######################################################################################################################
 
 
-class HomeWorldPickerInteraction(_DisplayNotificationMixin, _TargetHomeWorldMixin, _PieMenuPriorityMixin, SimPickerInteraction):
-    @classproperty
-    def client_id(cls):
-        return services.client_manager().get_first_client_id()
-
+class HomeWorldPickerInteraction(_DisplayNotificationMixin, _ClientIdMixin, _TargetHomeWorldMixin, _PieMenuPriorityMixin, SimPickerInteraction):
     @staticmethod
     def get_sim_info(sim_id: int):
         manager: SimInfoManager = services.sim_info_manager()
@@ -105,26 +106,53 @@ class HomeWorldPickerInteraction(_DisplayNotificationMixin, _TargetHomeWorldMixi
         return tuple(cls.get_sim_info(sim_id) for sim_id in sim_ids)
 
     def _push_continuations(self, *args, **kwargs):
-        sim_ids = args[0]
-        for sim_id in sim_ids:
-            execute_command('{} {}'.format(self.command_name, sim_id), self.client_id)
+        sim_infos = tuple(sim_info for sim_info in self.get_sim_infos(*args[0]) if sim_info is not None)
+        kuttoe_bulk_set_world_id(self.target_home_world, sim_infos, self.client_id, time_sliced=False)
 
         self._set_inventory_carry_target()
         super()._push_continuations(*args, **kwargs)
 
-        self.display_notification(*self.get_sim_infos(*sim_ids))
+        self.display_notification(*sim_infos)
 
 
-class WorldListPickerInteraction(_DisplayNotificationMixin, _TargetHomeWorldMixin, _PieMenuPriorityMixin, InteractionPickerSuperInteraction):
+class WorldListPickerInteraction(_DisplayNotificationMixin, _ClientIdMixin, _TargetHomeWorldMixin, _PieMenuPriorityMixin, InteractionPickerSuperInteraction):
     REMOVE_INSTANCE_TUNABLES = ('possible_actions', )
+    INSTANCE_TUNABLES = {
+        'push_alter_world_continuations': Tunable(tunable_type=bool, default=False),
+    }
+
+    def _get_alter_world_affordance(self, choice):
+        if self.push_alter_world_continuations:
+            return None
+
+        affordances = tuple(continuation.affordance for continuation in choice.continuation or ())
+        if len(affordances) != 1 or not issubclass(affordances[0], AlterWorldListImmediateSuperInteraction):
+            return None
+
+        return affordances[0]
+
+    def _apply_alter_world_choices(self, affordances):
+        target_worlds = defaultdict(list)
+        for affordance in affordances:
+            target_worlds[(affordance.source_world, affordance.alter_type)].append(affordance.target_home_world)
+
+        for ((source_world, alter_type), home_worlds) in target_worlds.items():
+            kuttoe_settings_bulk_alter_worlds_list(source_world, home_worlds, alter_type, self.client_id)
 
     def on_multi_choice_selected(self, picked_choice, **kwargs):
         if picked_choice is None or len(picked_choice) == 0:
             return
 
+        affordances = list()
         for choice in picked_choice:
-            self.push_tunable_continuation(choice.continuation)
+            affordance = self._get_alter_world_affordance(choice)
+
+            if affordance is None:
+                self.push_tunable_continuation(choice.continuation)
+            else:
+                affordances.append(affordance)
 
+        self._apply_alter_world_choices(affordances)
         self.display_notification(notification_type=NotificationType.SETTINGS_CHANGED)
 
     def on_choice_selected(self, choice, **kwargs):
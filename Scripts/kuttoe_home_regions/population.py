@@ -0,0 +1,371 @@
+#######################################################################################################################
+#  Imports                                                                                                            #
+#######################################################################################################################
+
+# python imports
+from collections import Counter, OrderedDict
+from csv import writer as csv_writer
+from json import dumps
+from typing import Dict, Tuple, Iterable, Optional
+
+# miscellaneous
+import services
+
+# sim4 imports
+from sims4.commands import Command, CommandType, Output
+from sims4.utils import classproperty
+
+# local imports
+from kuttoe_home_regions.home_worlds import HomeWorldIds
+from kuttoe_home_regions.commands import get_dump_file_path, get_home_world_from_name, kuttoe_bulk_set_world_id
+from kuttoe_home_regions.utils import TimeSlicedJob
+
+
+#######################################################################################################################
+#  Population Census                                                                                                  #
+#######################################################################################################################
+
+
+class PopulationCensus:
+    FIELDS = ('home_world', 'age', 'species', 'played', 'fixup_mismatch')
+    UNKNOWN_WORLD = 'UNKNOWN'
+
+    def __init__(self):
+        self._counts: Dict[Tuple, int] = Counter()
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @staticmethod
+    def get_home_world(sim_info):
+        household = getattr(sim_info, 'household', None)
+        if household is None:
+            return None
+
+        return HomeWorldIds.from_world_id(household._home_world_id)
+
+    @classmethod
+    def get_row(cls, sim_info) -> Tuple:
+        household = getattr(sim_info, 'household', None)
+        home_world = cls.get_home_world(sim_info)
+
+        return (
+            home_world.name if home_world is not None else cls.UNKNOWN_WORLD,
+            sim_info.age.name,
+            sim_info.species.name,
+            bool(household is not None and household.is_played_household),
+            bool(home_world is not None and home_world.has_fixup_mismatch(sim_info)),
+        )
+
+    def add(self, sim_info) -> Tuple:
+        row = self.get_row(sim_info)
+        self._counts[row] += 1
+        self._total += 1
+
+        return row
+
+    def run(self, sim_infos: Iterable, row_writer=None):
+        for sim_info in sim_infos:
+            row = self.add(sim_info)
+
+            if row_writer is not None:
+                row_writer((sim_info.id, *row))
+
+        return self
+
+    @property
+    def rows(self):
+        for (row, count) in sorted(self._counts.items()):
+            yield OrderedDict((*zip(self.FIELDS, row), ('count', count)))
+
+    def get_totals(self, field_name: str) -> Dict[str, int]:
+        index = self.FIELDS.index(field_name)
+        totals = Counter()
+
+        for (row, count) in self._counts.items():
+            totals[row[index]] += count
+
+        return totals
+
+    @property
+    def summary(self) -> str:
+        world_totals = self.get_totals('home_world').most_common()
+        by_world = ', '.join('{}={}'.format(name, count) for (name, count) in world_totals)
+        mismatches = self.get_totals('fixup_mismatch').get(True, 0)
+
+        return 'Census of {} Sims: {} ({} local fixup mismatches)'.format(self.total, by_world, mismatches)
+
+
+class CensusFileWriter:
+    FORMATS = ('csv', 'json')
+
+    def __init__(self, file, file_format: str, fields: Tuple[str, ...]):
+        self._file = file
+        self._fields = fields
+        self._csv = csv_writer(file, lineterminator='\n') if file_format == 'csv' else None
+
+        if self._csv is not None:
+            self._csv.writerow(fields)
+
+    def __call__(self, row: Tuple):
+        if self._csv is not None:
+            self._csv.writerow(row)
+        else:
+            self._file.write(dumps(OrderedDict(zip(self._fields, row))) + '\n')
+
+
+#######################################################################################################################
+#  Population Rebalancer                                                                                              #
+#######################################################################################################################
+
+
+class PopulationRebalancer:
+    _ACTIVE = None
+    _LATEST = None
+
+    def __init__(self, targets: Dict[HomeWorldIds, float], _connection=None,
+                 budget_ms: float = TimeSlicedJob.DEFAULT_BUDGET_MS):
+        total_weight = sum(targets.values()) or 1.0
+
+        self._targets = OrderedDict((world, weight / total_weight) for (world, weight) in targets.items())
+        self._connection = _connection
+        self._budget_ms = budget_ms
+        self._moved: Dict[HomeWorldIds, int] = Counter()
+        self._skipped = 0
+        self._trait_changes = 0
+        self._cancelled = False
+        self._plan = self._create_plan()
+        self._job = TimeSlicedJob(self._plan, self._move_household, self._complete, budget_ms=budget_ms)
+
+    @classproperty
+    def active(cls):
+        rebalancer: PopulationRebalancer = cls._ACTIVE
+
+        return rebalancer
+
+    @classproperty
+    def latest(cls):
+        rebalancer: PopulationRebalancer = cls._LATEST
+
+        return rebalancer
+
+    @classmethod
+    def _release(cls, rebalancer):
+        if cls._ACTIVE is rebalancer:
+            cls._ACTIVE = None
+
+    @staticmethod
+    def _get_townie_households():
+        households = services.household_manager().get_all()
+
+        return sorted((household for household in households if not household.is_played_household),
+                      key=lambda household: household.id)
+
+    def _create_plan(self) -> Tuple[Tuple[int, HomeWorldIds], ...]:
+        households_by_world = OrderedDict((world, list()) for world in self._targets)
+
+        for household in self._get_townie_households():
+            home_world = HomeWorldIds.from_world_id(household._home_world_id)
+            if home_world in households_by_world:
+                households_by_world[home_world].append(household.id)
+
+        total = sum(len(household_ids) for household_ids in households_by_world.values())
+        targets = {world: int(round(total * weight)) for (world, weight) in self._targets.items()}
+
+        surplus = [
+            household_id
+            for (world, household_ids) in households_by_world.items()
+            for household_id in household_ids[targets[world]:]
+        ]
+        deficits = [
+            world
+            for (world, household_ids) in households_by_world.items()
+            for _ in range(max(targets[world] - len(household_ids), 0))
+        ]
+
+        return tuple(zip(surplus, deficits))
+
+    def _move_household(self, move: Tuple[int, HomeWorldIds]):
+        household_id, home_world = move
+        household = services.household_manager().get(household_id)
+
+        if household is None or household.is_played_household:
+            self._skipped += 1
+            return
+
+        assignment = kuttoe_bulk_set_world_id(home_world, household.sim_info_gen(), time_sliced=False)
+        self._trait_changes += assignment.trait_changes
+        self._moved[home_world] += 1
+
+    def _complete(self, _job=None):
+        PopulationRebalancer._release(self)
+        if self._connection is not None:
+            Output(self._connection)(self.status)
+
+    @property
+    def is_done(self) -> bool:
+        return self._job.is_done
+
+    @property
+    def is_running(self) -> bool:
+        return self._job.is_running
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def state(self) -> str:
+        if self.is_cancelled:
+            return 'cancelled'
+        if self.is_done:
+            return 'complete'
+
+        return 'running' if self.is_running else 'paused'
+
+    @property
+    def status(self) -> str:
+        moved = ', '.join('{}={}'.format(world.name, count) for (world, count) in self._moved.items()) or 'none'
+        message = 'Population rebalance {}: {} of {} households processed ({} skipped, {} trait changes). Moved: {}'
+
+        return message.format(
+            self.state, self._job.processed, len(self._plan), self._skipped, self._trait_changes, moved)
+
+    def start(self):
+        if PopulationRebalancer._ACTIVE is not None and PopulationRebalancer._ACTIVE is not self:
+            PopulationRebalancer._ACTIVE.cancel()
+
+        PopulationRebalancer._ACTIVE = self
+        PopulationRebalancer._LATEST = self
+        self._job.start()
+
+        return self
+
+    def pause(self):
+        self._job.pause()
+
+    def resume(self, _connection=None):
+        self._connection = _connection or self._connection
+        self._job.start()
+
+    def cancel(self):
+        self._cancelled = True
+        self._job.cancel()
+        PopulationRebalancer._release(self)
+
+
+def parse_rebalance_targets(*target_args, _connection=None) -> Optional[Dict[HomeWorldIds, float]]:
+    targets = OrderedDict((world, 1.0) for world in HomeWorldIds.available_worlds)
+
+    for target in target_args:
+        world_name, _, weight = target.partition('=')
+        home_world = get_home_world_from_name(world_name, exact_only=True, _connection=_connection)
+        if home_world is None or home_world not in targets:
+            return None
+
+        try:
+            targets[home_world] = max(float(weight or 1.0), 0.0)
+        except ValueError:
+            Output(_connection)('Invalid weight for World {}: {}'.format(home_world.name, weight))
+            return None
+
+    return targets
+
+
+#######################################################################################################################
+#  Population Console Commands                                                                                        #
+#######################################################################################################################
+
+
+@Command('kuttoe.census', command_type=CommandType.Cheat)
+def census(file_format: str = 'csv', file_path: str = None, _connection=None):
+    output = Output(_connection)
+    file_format = file_format.lower()
+
+    if file_format not in CensusFileWriter.FORMATS:
+        valid_formats = ', '.join(CensusFileWriter.FORMATS)
+        output('Invalid census format: {}\n\nValid formats: {}'.format(file_format, valid_formats))
+        return False
+
+    population = PopulationCensus()
+    sims_file_path = get_dump_file_path('Kuttoe_Census_Sims.{}'.format(file_format), file_path)
+    summary_file_path = get_dump_file_path('Kuttoe_Census_Summary.{}'.format(file_format), file_path)
+
+    with open(sims_file_path, 'w+', newline='') as file:
+        row_writer = CensusFileWriter(file, file_format, ('sim_id', *PopulationCensus.FIELDS))
+        population.run(services.sim_info_manager().get_all(), row_writer)
+
+    with open(summary_file_path, 'w+', newline='') as file:
+        row_writer = CensusFileWriter(file, file_format, (*PopulationCensus.FIELDS, 'count'))
+        for row in population.rows:
+            row_writer(tuple(row.values()))
+
+    output(population.summary)
+    output(f'Successfully wrote census to files: {sims_file_path}, {summary_file_path}')
+
+    return True
+
+
+@Command('kuttoe.rebalance_population', command_type=CommandType.Cheat)
+def rebalance_population(*target_args, _connection=None):
+    targets = parse_rebalance_targets(*target_args, _connection=_connection)
+    if not targets:
+        return False
+
+    rebalancer = PopulationRebalancer(targets, _connection).start()
+    if not rebalancer.is_done:
+        Output(_connection)(rebalancer.status)
+
+    return True
+
+
+@Command('kuttoe.rebalance_population_cancel', command_type=CommandType.Cheat)
+def rebalance_population_cancel(_connection=None):
+    output = Output(_connection)
+    rebalancer = PopulationRebalancer.active
+
+    if rebalancer is None or rebalancer.is_done:
+        output('No population rebalance is running')
+        return False
+
+    rebalancer.cancel()
+    output(rebalancer.status)
+    return True
+
+
+@Command('kuttoe.rebalance_population_pause', command_type=CommandType.Cheat)
+def rebalance_population_pause(_connection=None):
+    output = Output(_connection)
+    rebalancer = PopulationRebalancer.active
+
+    if rebalancer is None or not rebalancer.is_running:
+        output('No population rebalance is running')
+        return False
+
+    rebalancer.pause()
+    output(rebalancer.status)
+    return True
+
+
+@Command('kuttoe.rebalance_population_resume', command_type=CommandType.Cheat)
+def rebalance_population_resume(_connection=None):
+    output = Output(_connection)
+    rebalancer = PopulationRebalancer.active
+
+    if rebalancer is None or rebalancer.is_done:
+        output('No population rebalance to resume')
+        return False
+
+    rebalancer.resume(_connection)
+    output(rebalancer.status)
+    return True
+
+
+@Command('kuttoe.rebalance_population_status', command_type=CommandType.Cheat)
+def rebalance_population_status(_connection=None):
+    rebalancer = PopulationRebalancer.latest
+
+    Output(_connection)(rebalancer.status if rebalancer is not None else 'No population rebalance has been started')
+    return True
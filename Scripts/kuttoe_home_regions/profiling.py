@@ -0,0 +1,58 @@
+#######################################################################################################################
+#  Imports                                                                                                            #
+#######################################################################################################################
+
+# python imports
+from collections import OrderedDict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Any
+
+# sim4 imports
+from sims4.utils import classproperty
+
+
+#######################################################################################################################
+#  Startup Profiler                                                                                                   #
+#######################################################################################################################
+
+
+class StartupProfiler:
+    _SECTIONS: Dict[str, Dict[str, Any]] = OrderedDict()
+
+    @classmethod
+    def record(cls, section_name: str, **stats):
+        cls._SECTIONS.setdefault(section_name, OrderedDict()).update(stats)
+
+    @classmethod
+    def increment(cls, section_name: str, stat_name: str, amount=1):
+        section = cls._SECTIONS.setdefault(section_name, OrderedDict())
+        section[stat_name] = section.get(stat_name, 0) + amount
+
+    @classmethod
+    @contextmanager
+    def section(cls, section_name: str, **stats):
+        start_time = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (perf_counter() - start_time) * 1000
+            cls.record(section_name, elapsed_ms=round(elapsed_ms, 3), **stats)
+
+    @classmethod
+    def clear(cls, section_name: str = None):
+        if section_name is None:
+            cls._SECTIONS.clear()
+        else:
+            cls._SECTIONS.pop(section_name, None)
+
+    @classproperty
+    def sections(cls) -> Dict[str, Dict[str, Any]]:
+        return cls._SECTIONS
+
+    @classproperty
+    def report(cls) -> Dict[str, str]:
+        return {
+            section_name: ', '.join('{}={}'.format(key, value) for (key, value) in stats.items())
+            for (section_name, stats) in cls._SECTIONS.items()
+        }
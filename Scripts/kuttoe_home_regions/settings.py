@@ -16,11 +16,20 @@ from sims4.tuning.tunable import TunableEnumSet, TunableTuple
 from sims4.commands import Command, CommandType
 
 # local imports
-from kuttoe_home_regions.home_worlds import HomeWorldIds
+from kuttoe_home_regions.home_worlds import HomeWorldIds, AvailableWorlds
+from kuttoe_home_regions.utils import VersionedCache
 from kuttoe_home_regions.tunable import TunableInteractionName
 from kuttoe_home_regions.ui import NotificationType
 
 
+#######################################################################################################################
+#  Named Tuples                                                                                                       #
+#######################################################################################################################
+
+
+CompiledWorldSettings = namedtuple('CompiledWorldSettings', ['soft', 'worlds', 'mask'])
+
+
 #######################################################################################################################
 #  Settings Tuning                                                                                                    #
 #######################################################################################################################
@@ -91,6 +100,8 @@ class Settings:
     BIDIRECTIONAL_TOGGLE = Tunable(tunable_type=bool, default=False, allow_empty=False, needs_tuning=True)
     HIGH_SCHOOL_TOGGLE = Tunable(tunable_type=bool, default=True, allow_empty=False, needs_tuning=True)
     _SETTINGS = None
+    _VERSION = 0
+    _COMPILED_WORLD_SETTINGS = VersionedCache()
 
     @classmethod
     def create_settings_console_command(cls, notification_type: NotificationType):
@@ -266,6 +277,7 @@ class Settings:
         default_settings = cls.default_settings
 
         cls._SETTINGS = dict(**default_settings)
+        cls._VERSION += 1
         try:
             with open(settings_directory) as settings_file:
                 loaded_settings = load(settings_file)
@@ -280,6 +292,10 @@ class Settings:
             for key in keys:
                 cls._SETTINGS.pop(key)
 
+    @classproperty
+    def version(cls) -> int:
+        return cls._VERSION
+
     @classproperty
     def settings(cls) -> dict:
         if cls._SETTINGS is None:
@@ -294,6 +310,19 @@ class Settings:
 
         return {key: cls.settings['{}_{}'.format(name_base, key)] for key in keys}
 
+    @classmethod
+    def _compile_world_settings(cls, home_world: HomeWorldIds) -> CompiledWorldSettings:
+        world_settings = cls.get_world_settings(home_world)
+        worlds = frozenset(HomeWorldIds[name] for name in world_settings['Worlds'] if name in HomeWorldIds)
+
+        return CompiledWorldSettings(world_settings['Soft'], worlds, AvailableWorlds.get_worlds_mask(worlds))
+
+    @classmethod
+    def get_compiled_world_settings(cls, home_world: HomeWorldIds) -> CompiledWorldSettings:
+        version = (cls.version, AvailableWorlds.snapshot.generation)
+
+        return cls._COMPILED_WORLD_SETTINGS.get(home_world, version, lambda: cls._compile_world_settings(home_world))
+
     @classmethod
     def get_notification_setting(cls, notification_type: NotificationType) -> bool:
         return cls.settings[notification_type.setting_name]
@@ -320,13 +349,19 @@ class Settings:
         return token(*string_tokens)
 
     @classmethod
-    def update_setting(cls, setting_key: str, setting_value):
-        if setting_key not in cls.settings:
+    def update_settings(cls, settings: Dict[str, Any]) -> bool:
+        updates = {key: value for (key, value) in settings.items() if key in cls.settings}
+        if not updates:
             return False
 
-        cls.settings[setting_key] = setting_value
+        cls.settings.update(updates)
+        cls._VERSION += 1
         cls.dump_settings(cls.settings_directory, cls.settings)
-        return True
+        return len(updates) == len(settings)
+
+    @classmethod
+    def update_setting(cls, setting_key: str, setting_value):
+        return cls.update_settings({setting_key: setting_value})
 
     @classmethod
     def toggle_setting(cls, setting_key: str, setting_value: bool = None):
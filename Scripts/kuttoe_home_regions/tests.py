@@ -3,7 +3,9 @@
 #######################################################################################################################
 
 # python imports
-from typing import List, Set
+from collections import OrderedDict, Counter
+from time import perf_counter
+from typing import List, Set, Dict, Tuple
 
 # sim4 imports
 from sims4.tuning.tunable import AutoFactoryInit, TunableEnumEntry, HasTunableSingletonFactory, TunableEnumSet
@@ -11,12 +13,13 @@ from sims4.tuning.tunable import TunableList, TunablePackSafeReference, Tunable
 from sims4.localization import TunableLocalizedStringFactory
 from sims4.utils import constproperty
 from sims4.resources import Types
-from sims4.common import Pack, is_available_pack
+from sims4.common import Pack
 
 # event testing imports
 from event_testing.test_base import BaseTest
 from event_testing.results import TestResult
 from event_testing.test_variants import TunableIdentityTest
+from event_testing.tests import TestList
 
 # interaction imports
 from interactions import ParticipantTypeSingle, ParticipantTypeSingleSim, ParticipantType
@@ -36,9 +39,11 @@ from services import get_instance_manager
 from tunable_utils.tunable_white_black_list import TunableWhiteBlackList
 
 # local imports
-from kuttoe_home_regions.home_worlds import HomeWorldIds
+from kuttoe_home_regions.home_worlds import HomeWorldIds, AvailableWorlds
 from kuttoe_home_regions.commands import AlterType
-from kuttoe_home_regions.utils import construct_auto_init_factory, make_immutable_slots_class
+from kuttoe_home_regions.utils import make_immutable_slots_class, FlyweightRegistry
+from kuttoe_home_regions.indexes import HomeWorldSimIndex
+from kuttoe_home_regions.profiling import StartupProfiler
 from kuttoe_home_regions.ui import NotificationType
 
 
@@ -66,6 +71,12 @@ class _WorldsTestsBase(HasTunableSingletonFactory, AutoFactoryInit, BaseTest):
     def worlds_list(self) -> List[str]:
         return self.world_settings['Worlds']
 
+    @property
+    def compiled_settings(self):
+        from kuttoe_home_regions.settings import Settings
+
+        return Settings.get_compiled_world_settings(self.world_value_source)
+
 
 class WorldsAvailableLeftTest(_WorldsTestsBase):
     @property
@@ -74,18 +85,24 @@ class WorldsAvailableLeftTest(_WorldsTestsBase):
 
     @constproperty
     def all_worlds():
-        return {world.name for world in HomeWorldIds if world is not HomeWorldIds.DEFAULT}
+        return AvailableWorlds.snapshot.all_worlds
 
     def get_available_worlds(self):
-        return self.get_all_possible_worlds() - set(self.worlds_list)
+        return self.get_all_possible_worlds() - self.compiled_settings.worlds
 
     def get_all_possible_worlds(self):
-        return self.all_worlds - {self.target_home_world.name}
+        return self.all_worlds - {self.target_home_world}
+
+    def has_available_worlds(self) -> bool:
+        snapshot = AvailableWorlds.snapshot
+        target_mask = 1 << snapshot.ordinals[self.target_home_world]
+
+        return bool(snapshot.all_mask & ~target_mask & ~self.compiled_settings.mask)
 
     def __call__(self):
-        if self.alter_type == AlterType.ALLOW_WORLD and self.get_available_worlds():
+        if self.alter_type == AlterType.ALLOW_WORLD and self.has_available_worlds():
             return TestResult.TRUE
-        elif self.alter_type == AlterType.DISALLOW_WORLD and self.worlds_list:
+        elif self.alter_type == AlterType.DISALLOW_WORLD and self.compiled_settings.worlds:
             return TestResult.TRUE
         else:
             return TestResult(False, 'World {} does not fit the required constraints', self.target_home_world.name,
@@ -102,7 +119,7 @@ class IsWorldAvailableTest(_WorldsTestsBase):
         return self.source_world
 
     def __call__(self):
-        result = self.target_home_world.name in self.worlds_list
+        result = self.target_home_world in self.compiled_settings.worlds
 
         if self.alter_type == AlterType.DISALLOW_WORLD and result:
             return TestResult.TRUE
@@ -189,12 +206,175 @@ class PackTest(HasTunableSingletonFactory, AutoFactoryInit, BaseTest):
         return {}
 
     def __call__(self):
-        result = all(is_available_pack(pack) for pack in self.required_packs) != self.invert
+        result = AvailableWorlds.are_packs_available(self.required_packs) != self.invert
 
         return TestResult(result, 'Pack requirements of {} does not have the required value of {}',
                           self.required_packs, not self.invert, tooltip=self.tooltip)
 
 
+class CandidatePreFilterTest(HasTunableSingletonFactory, AutoFactoryInit, BaseTest):
+    PROFILER_SECTION = 'candidate_prefilter'
+    FACTORY_TUNABLES = {
+        'participant': TunableEnumEntry(tunable_type=ParticipantType, default=ParticipantType.PickedSim),
+        'target_home_world': TunableEnumEntry(tunable_type=HomeWorldIds, default=HomeWorldIds.DEFAULT),
+        'blacklist_traits': TunableList(tunable=Trait.TunablePackSafeReference(), allow_none=False),
+    }
+    EXCLUDED_AGES = frozenset({Age.TODDLER})
+    _STATS: Dict[str, int] = Counter()
+
+    def get_expected_args(self):
+        return {'subjects': self.participant}
+
+    def _get_rejection_reason(self, sim_info):
+        household = getattr(sim_info, 'household', None)
+
+        if sim_info.age in self.EXCLUDED_AGES:
+            return 'age'
+        if sim_info.species != Species.HUMAN:
+            return 'species'
+        if household is not None and household.is_played_household:
+            return 'played'
+        if HomeWorldSimIndex.get().is_in_world(sim_info, self.target_home_world.value):
+            return 'home_world'
+        if any(sim_info.has_trait(trait) for trait in self.blacklist_traits if trait is not None):
+            return 'trait'
+
+        return None
+
+    @classmethod
+    def _record_result(cls, reason: str = None):
+        cls._STATS['checked'] += 1
+        if reason is not None:
+            cls._STATS['rejected'] += 1
+            cls._STATS['rejected_{}'.format(reason)] += 1
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, float]:
+        stats = dict(cls._STATS)
+        checked = stats.get('checked', 0)
+        stats['rejection_rate'] = round(stats.get('rejected', 0) / checked, 4) if checked else 0.0
+
+        return stats
+
+    @classmethod
+    def report(cls):
+        StartupProfiler.record(cls.PROFILER_SECTION, **cls.get_stats())
+
+    def __call__(self, subjects=()):
+        for sim_info in subjects:
+            reason = self._get_rejection_reason(sim_info)
+            self._record_result(reason)
+
+            if reason is not None:
+                return TestResult(False, 'Sim {} rejected by candidate pre-filter ({})', sim_info, reason,
+                                  tooltip=self.tooltip)
+
+        return TestResult.TRUE
+
+
+#######################################################################################################################
+#  Adaptive Test Lists                                                                                                #
+#######################################################################################################################
+
+
+class TestOrderStats:
+    __slots__ = ('calls', 'rejections', 'total_time')
+
+    def __init__(self):
+        self.calls = 0
+        self.rejections = 0
+        self.total_time = 0.0
+
+    @property
+    def mean_cost(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    @property
+    def rejection_rate(self) -> float:
+        return (self.rejections + 1) / (self.calls + 2)
+
+    @property
+    def priority(self) -> float:
+        return self.mean_cost / self.rejection_rate
+
+
+class AdaptiveTestList(TestList):
+    REORDER_INTERVAL = 64
+    _REGISTRY: Dict[str, 'AdaptiveTestList'] = OrderedDict()
+
+    @classmethod
+    def create(cls, name: str, tests, pinned: int = 0):
+        test_list = cls(tests)
+        test_list._pinned = pinned
+        cls._REGISTRY[name] = test_list
+
+        return test_list
+
+    @classmethod
+    def get_registered(cls) -> Dict[str, 'AdaptiveTestList']:
+        return cls._REGISTRY
+
+    @property
+    def stats(self) -> Tuple[TestOrderStats, ...]:
+        if '_stats' not in self.__dict__:
+            self._stats = tuple(TestOrderStats() for _ in self)
+            self._order = tuple(range(len(self)))
+            self._runs = 0
+
+        return self._stats
+
+    @property
+    def order(self) -> Tuple[int, ...]:
+        return self.__dict__.get('_order', tuple(range(len(self))))
+
+    @property
+    def pinned(self) -> int:
+        return self.__dict__.get('_pinned', 0)
+
+    def _reorder(self):
+        stats = self.stats
+        pinned = min(self.pinned, len(self))
+        adaptive = sorted(range(pinned, len(self)), key=lambda index: (stats[index].priority, index))
+        self._order = (*range(pinned), *adaptive)
+
+    def run_tests(self, resolver, skip_safe_tests=False, search_for_tooltip=False):
+        if search_for_tooltip:
+            return super().run_tests(resolver, skip_safe_tests=skip_safe_tests, search_for_tooltip=search_for_tooltip)
+
+        stats = self.stats
+        self._runs += 1
+        if self._runs % self.REORDER_INTERVAL == 0:
+            self._reorder()
+
+        for index in self._order:
+            test = self[index]
+            if skip_safe_tests and getattr(test, 'safe_to_skip', False):
+                continue
+
+            start_time = perf_counter()
+            result = resolver(test)
+            test_stats = stats[index]
+            test_stats.total_time += perf_counter() - start_time
+            test_stats.calls += 1
+
+            if not result:
+                test_stats.rejections += 1
+                return result
+
+        return TestResult.TRUE
+
+    @property
+    def diagnostics(self):
+        stats = self.stats
+
+        for index in self.order:
+            test_stats = stats[index]
+            yield (
+                type(self[index]).__name__, test_stats.calls, round(test_stats.rejections / max(test_stats.calls, 1), 3),
+                round(test_stats.mean_cost * 1e6, 2),
+            )
+
+
 #######################################################################################################################
 #  Test Set Mixin                                                                                                     #
 #######################################################################################################################
@@ -207,6 +387,18 @@ class _TestSetMixin:
     TRAIT_BLACKLIST = TunableList(tunable=Trait.TunablePackSafeReference(), allow_none=False)
     VENUE_FILTER = TunableWhiteBlackList(tunable=TunablePackSafeReference(manager=get_instance_manager(Types.VENUE)))
 
+    @staticmethod
+    def _create_region_tooltip(disabled_tooltip, home_world: HomeWorldIds):
+        return lambda *tokens: disabled_tooltip(home_world.region_name(), *tokens)
+
+    @staticmethod
+    def get_region_tooltip(disabled_tooltip, home_world: HomeWorldIds):
+        args = dict()
+        args['disabled_tooltip'] = disabled_tooltip
+        args['home_world'] = home_world
+
+        return FlyweightRegistry.get('region_tooltip', _TestSetMixin._create_region_tooltip, **args)
+
     @staticmethod
     def get_notification_setting_test(notification_type: NotificationType, invert: bool = False, disabled_tooltip=None):
         args = dict()
@@ -214,7 +406,7 @@ class _TestSetMixin:
         args['notification_type'] = notification_type
         args['tooltip'] = disabled_tooltip
 
-        return construct_auto_init_factory(NotificationSettingValueTest, **args)
+        return FlyweightRegistry.construct(NotificationSettingValueTest, **args)
 
     @staticmethod
     def get_pack_test(packs_list: Set[Pack], invert: bool = False, disabled_tooltip=None):
@@ -223,7 +415,7 @@ class _TestSetMixin:
         args['required_packs'] = packs_list
         args['tooltip'] = disabled_tooltip
 
-        return construct_auto_init_factory(PackTest, **args)
+        return FlyweightRegistry.construct(PackTest, **args)
 
     @staticmethod
     def get_boolean_toggle_test(setting_name: str, invert: bool = False, disabled_tooltip=None):
@@ -232,7 +424,7 @@ class _TestSetMixin:
         args['setting_name'] = setting_name
         args['tooltip'] = disabled_tooltip
 
-        return construct_auto_init_factory(BooleanSettingValueTest, **args)
+        return FlyweightRegistry.construct(BooleanSettingValueTest, **args)
 
     @staticmethod
     def get_soft_filter_toggle_test(source_world: HomeWorldIds, invert: bool = False, disabled_tooltip=None):
@@ -240,9 +432,9 @@ class _TestSetMixin:
         args['target_home_world'] = source_world
         args['invert'] = invert
         if disabled_tooltip:
-            args['tooltip'] = lambda *tokens: disabled_tooltip(source_world.region_name(), *tokens)
+            args['tooltip'] = _TestSetMixin.get_region_tooltip(disabled_tooltip, source_world)
 
-        return construct_auto_init_factory(SoftFilterToggleValueTest, **args)
+        return FlyweightRegistry.construct(SoftFilterToggleValueTest, **args)
 
     @staticmethod
     def get_is_world_available_test(
@@ -255,7 +447,7 @@ class _TestSetMixin:
         args['target_home_world'] = target_world
         args['alter_type'] = alter_type
 
-        return construct_auto_init_factory(IsWorldAvailableTest, **args)
+        return FlyweightRegistry.construct(IsWorldAvailableTest, **args)
 
     @staticmethod
     def get_worlds_available_left_test(
@@ -267,9 +459,9 @@ class _TestSetMixin:
         args['target_home_world'] = target_world
         args['alter_type'] = alter_type
         if disabled_tooltip:
-            args['tooltip'] = lambda *tokens: disabled_tooltip(target_world.region_name(), *tokens)
+            args['tooltip'] = _TestSetMixin.get_region_tooltip(disabled_tooltip, target_world)
 
-        return construct_auto_init_factory(WorldsAvailableLeftTest, **args)
+        return FlyweightRegistry.construct(WorldsAvailableLeftTest, **args)
 
     def get_home_region_test(self, participant: ParticipantType = ParticipantType.TargetSim):
         args = dict()
@@ -278,7 +470,7 @@ class _TestSetMixin:
         args['region'] = self.region
         args['tooltip'] = self.ALREADY_RESIDENT_TOOLTIP
 
-        return construct_auto_init_factory(HomeRegionTest, **args)
+        return FlyweightRegistry.construct(HomeRegionTest, **args)
 
     def get_trait_blacklist(self, participant: ParticipantType = ParticipantType.TargetSim):
         args = dict()
@@ -291,7 +483,7 @@ class _TestSetMixin:
         args['num_blacklist_allowed'] = 0
         args['apply_thresholds_on_individual_basis'] = True
 
-        return construct_auto_init_factory(TraitTest, **args)
+        return FlyweightRegistry.construct(TraitTest, **args)
 
     @staticmethod
     def get_identity_test(subjects_match=False):
@@ -302,25 +494,33 @@ class _TestSetMixin:
         args['use_definition'] = False
         args['use_part_owner'] = False
 
-        return construct_auto_init_factory(TunableIdentityTest, has_factory=False, **args)
+        return FlyweightRegistry.construct(TunableIdentityTest, has_factory=False, **args)
 
     @staticmethod
     def get_sim_info_test(participant: ParticipantType = ParticipantType.TargetSim, is_npc=True):
         args = dict()
         args['who'] = participant
         args['ages'] = {age for age in Age.values if age not in (Age.TODDLER, )}
-        args['species'] = construct_auto_init_factory(_SpeciesTestSpecies, species={Species.HUMAN})
+        args['species'] = FlyweightRegistry.construct(_SpeciesTestSpecies, species={Species.HUMAN})
         args['npc'] = is_npc
         args['match_type'] = MatchType.MATCH_ALL
 
-        return construct_auto_init_factory(SimInfoTest, **args)
+        return FlyweightRegistry.construct(SimInfoTest, **args)
+
+    def get_candidate_prefilter_test(self, participant: ParticipantType = ParticipantType.PickedSim):
+        args = dict()
+        args['participant'] = participant
+        args['target_home_world'] = self.home_world
+        args['blacklist_traits'] = self.TRAIT_BLACKLIST
+
+        return FlyweightRegistry.construct(CandidatePreFilterTest, **args)
 
     def get_zone_test(self, participant: ParticipantTypeSingleSim = ParticipantTypeSingleSim.TargetSim,
                       use_tooltip=True):
         args = dict()
         args['tooltip'] = self.SIM_HAS_HOUSE_TOOLTIP if use_tooltip else None
         args['zone_source_invalid_fallback'] = True
-        args['zone_source'] = ParticipantHomeZone(participant=participant)
+        args['zone_source'] = FlyweightRegistry.get(ParticipantHomeZone, participant=participant)
 
         zone_test_args = dict()
         zone_test_args['business_tests'] = None
@@ -333,7 +533,7 @@ class _TestSetMixin:
         zone_test_args['zone_modifiers'] = None
         zone_test_args['use_source_venue'] = False
         zone_test_args['venue_type'] = self.VENUE_FILTER
-        args['zone_tests'] = make_immutable_slots_class(**zone_test_args)
+        args['zone_tests'] = FlyweightRegistry.get(make_immutable_slots_class, **zone_test_args)
 
-        return construct_auto_init_factory(ZoneTest, **args)
+        return FlyweightRegistry.construct(ZoneTest, **args)
 
@@ -5,11 +5,9 @@
 # sim4 imports
 from sims4.utils import constproperty
 
-# event testing imports
-from event_testing.tests import TestList
-
 # local imports
 from kuttoe_home_regions.interactions import CommandImmediateSuperInteraction
+from kuttoe_home_regions.tests import AdaptiveTestList
 from kuttoe_home_regions.tunable.python_based_interaction_data import PythonBasedInteractionWithRegionData
 
 
@@ -32,4 +30,4 @@ class CommandInteractionTuningData(PythonBasedInteractionWithRegionData):
         base_tests.append(self.get_zone_test())
         base_tests.append(self.get_home_region_test())
 
-        return TestList(base_tests)
+        return AdaptiveTestList.create('{}.global_tests'.format(self.interaction_name), base_tests)
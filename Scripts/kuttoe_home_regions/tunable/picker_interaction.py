@@ -18,6 +18,7 @@ from ui.ui_dialog_picker import UiSimPicker
 
 # local imports
 from kuttoe_home_regions.interactions import HomeWorldPickerInteraction
+from kuttoe_home_regions.tests import AdaptiveTestList
 from kuttoe_home_regions.tunable.python_based_interaction_data import PythonBasedInteractionWithRegionData
 
 
@@ -46,12 +47,14 @@ class PickerInteractionTuningData(PythonBasedInteractionWithRegionData):
     @property
     def sim_tests(self):
         base_tests = list()
+        base_tests.append(self.get_candidate_prefilter_test(participant=ParticipantType.PickedSim))
         base_tests.append(self.get_sim_info_test(participant=ParticipantType.PickedSim))
         base_tests.append(self.get_trait_blacklist(participant=ParticipantType.PickedSim))
         base_tests.append(self.get_zone_test(participant=ParticipantType.PickedSim))
         base_tests.append(self.get_home_region_test(participant=ParticipantType.PickedSim))
 
-        return CompoundTestList([TestList(base_tests)])
+        test_list_name = '{}.sim_tests'.format(self.interaction_name)
+        return CompoundTestList([AdaptiveTestList.create(test_list_name, base_tests, pinned=1)])
 
     @constproperty
     def locked_args() -> dict:
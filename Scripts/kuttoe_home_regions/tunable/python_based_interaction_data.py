@@ -27,7 +27,8 @@ from interactions.base.immediate_interaction import ImmediateSuperInteraction
 from tunable_utils.tunable_object_generator import _ObjectGeneratorFromParticipant
 
 # local imports
-from kuttoe_home_regions.utils import construct_auto_init_factory, make_immutable_slots_class
+from kuttoe_home_regions.utils import construct_auto_init_factory, make_immutable_slots_class, ClassFactoryCache
+from kuttoe_home_regions.utils import freeze_key
 from kuttoe_home_regions.home_worlds import HomeWorldIds
 from kuttoe_home_regions.ui import InteractionType, NotificationType
 from kuttoe_home_regions.tests import _TestSetMixin
@@ -102,6 +103,10 @@ class PythonBasedInteractionData(
 
         return properties_mapping
 
+    @constproperty
+    def dynamic_properties() -> frozenset:
+        return frozenset()
+
     @property
     def category(self):
         return self.interaction_category
@@ -143,19 +148,59 @@ class PythonBasedInteractionData(
         locked_tunables.update(self.default_locked_tunables)
 
         properties_mapping.update(self.base_properties_mapping)
+        dynamic_properties = self.dynamic_properties
+        property_values = {
+            name: self._get_property_value(prop_name)
+            for (name, prop_name) in properties_mapping.items()
+            if prop_name not in dynamic_properties
+        }
+
+        spec = dict()
+        spec['cls_base'] = cls_base
+        spec['name'] = self.interaction_name
+        spec['locked_tunables'] = locked_tunables
+        spec['property_values'] = property_values
+        if any(prop_name in dynamic_properties for prop_name in properties_mapping.values()):
+            spec['dynamic_source'] = self
+
+        def _builder():
+            return self._create_tuning_class(cls_base, locked_tunables, properties_mapping, property_values)
+
+        try:
+            freeze_key(spec)
+        except TypeError:
+            return _builder()
+
+        return ClassFactoryCache.get('tuning_class', spec, _builder)
+
+    def _get_property_value(self, prop_name: str):
+        prop = getattr(self, prop_name, None)
+
+        return prop() if ismethod(prop) else prop
+
+    def _create_tuning_class(
+            self,
+            cls_base: ImmediateSuperInteraction,
+            locked_tunables: Dict[str, Any],
+            properties_mapping: Dict[str, str],
+            property_values: Dict[str, Any]
+    ):
         removed_tunables = tuple(properties_mapping.keys())
 
         class _InteractionTuningClass(cls_base):
             REMOVE_INSTANCE_TUNABLES = removed_tunables
 
         for (name, value) in properties_mapping.items():
-            def prop_getter(prop_name):
-                prop = getattr(self, prop_name, None)
-                prop_value = prop() if ismethod(prop) else prop
+            def prop_getter(attribute_name, prop_name):
+                def _get_value(cls):
+                    return property_values[attribute_name]
+
+                def _get_dynamic_value(cls):
+                    return self._get_property_value(prop_name)
 
-                return classproperty(lambda cls: prop_value)
+                return classproperty(_get_value if attribute_name in property_values else _get_dynamic_value)
 
-            setattr(_InteractionTuningClass, name, prop_getter(value))
+            setattr(_InteractionTuningClass, name, prop_getter(name, value))
 
         lock_instance_tunables(_InteractionTuningClass, **locked_tunables)
         _InteractionTuningClass.__name__ = self.interaction_name
@@ -26,7 +26,7 @@ from ui.ui_dialog_picker import UiItemPicker
 
 # local imports
 from kuttoe_home_regions.utils import construct_auto_init_factory, make_immutable_slots_class
-from kuttoe_home_regions.utils import create_tunable_factory_with_overrides
+from kuttoe_home_regions.utils import create_tunable_factory_with_overrides, VersionedCache
 from kuttoe_home_regions.interactions import BooleanSettingTogglePickerInteraction
 from kuttoe_home_regions.interactions import BooleanToggleSettingImmediateSuperInteraction
 from kuttoe_home_regions.snippets.disabled_interation_behaviour import TunableDisabledInteractionBehaviourSnippet
@@ -43,6 +43,7 @@ from kuttoe_home_regions.tunable.python_based_interaction_data import PythonBase
 
 class _ToggleInteractionTuningDataBase:
     __CACHE = dict()
+    _PICKER_ROW_CACHE = VersionedCache()
     FACTORY_TUNABLES = {
         'disabled_interaction_behaviour': TunableDisabledInteractionBehaviourSnippet(),
         'setting_value_mapping': TunableSettingValue(),
@@ -57,6 +58,14 @@ class _ToggleInteractionTuningDataBase:
 
         return properties_mapping
 
+    @constproperty
+    def dynamic_properties() -> frozenset:
+        return frozenset({'possible_actions'})
+
+    @classproperty
+    def picker_row_cache(cls):
+        return cls._PICKER_ROW_CACHE
+
     @staticmethod
     def _register_interaction(interaction_cls, interaction_data):
         affordance_manager = get_instance_manager(Types.INTERACTION)
@@ -97,7 +106,15 @@ class _ToggleInteractionTuningDataBase:
         args = additional_picker_item_args.get('args', tuple())
         kwargs = additional_picker_item_args.get('kwargs', dict())
 
-        return tuple(self._create_picker_item(toggle_value, *args, **kwargs) for toggle_value in (True, False))
+        return tuple(self._get_picker_item(toggle_value, *args, **kwargs) for toggle_value in (True, False))
+
+    def _get_picker_item(self, toggle_value: bool, *additional_args, **kwargs):
+        from kuttoe_home_regions.settings import Settings
+
+        key = (self.interaction_name, toggle_value, additional_args, tuple(sorted(kwargs.items())))
+        return self.picker_row_cache.get(
+            key, Settings.version, lambda: self._create_picker_item(toggle_value, *additional_args, **kwargs)
+        )
 
     @classmethod
     def _create_continuation(cls, toggle_value: bool, *additional_args, **kwargs):
@@ -27,8 +27,8 @@ from ui.ui_dialog_picker import UiItemPicker
 
 # local imports
 from kuttoe_home_regions.utils import construct_auto_init_factory, make_immutable_slots_class
-from kuttoe_home_regions.utils import create_tunable_factory_with_overrides
-from kuttoe_home_regions.home_worlds import HomeWorldIds, TunableIconDefinition
+from kuttoe_home_regions.utils import create_tunable_factory_with_overrides, VersionedCache
+from kuttoe_home_regions.home_worlds import HomeWorldIds, TunableIconDefinition, AvailableWorlds
 from kuttoe_home_regions.commands import AlterType
 from kuttoe_home_regions.interactions import WorldListPickerInteraction, AlterWorldListImmediateSuperInteraction
 from kuttoe_home_regions.tunable import TunableInteractionName
@@ -58,6 +58,8 @@ class _WorldListInteractionTuningDataBase(PythonBasedInteractionWithRegionData):
         'item_icon': TunableIconDefinition(),
     }
 
+    _PICKER_ROW_CACHE = VersionedCache()
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__()
         cls._SUB_INTERACTION_CACHE = defaultdict(dict)
@@ -70,10 +72,18 @@ class _WorldListInteractionTuningDataBase(PythonBasedInteractionWithRegionData):
 
         return properties_mapping
 
+    @constproperty
+    def dynamic_properties() -> frozenset:
+        return frozenset({'possible_actions'})
+
     @classproperty
     def sub_interaction_cache(cls):
         return cls._SUB_INTERACTION_CACHE
 
+    @classproperty
+    def picker_row_cache(cls):
+        return cls._PICKER_ROW_CACHE
+
     @constproperty
     def class_base():
         return WorldListPickerInteraction
@@ -102,14 +112,13 @@ class _WorldListInteractionTuningDataBase(PythonBasedInteractionWithRegionData):
 
         return _AlterWorldInteraction
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def get_sub_interaction(self, target_world: HomeWorldIds):
+        sub_interactions = self.sub_interaction_cache[self.home_world]
 
-        for home_world in HomeWorldIds:
-            if home_world in (HomeWorldIds.DEFAULT, self.home_world):
-                continue
+        if target_world not in sub_interactions:
+            sub_interactions[target_world] = self._create_sub_interaction(target_world)
 
-            self.sub_interaction_cache[self.home_world][home_world] = self._create_sub_interaction(home_world)
+        return sub_interactions[target_world]
 
     def custom_picker_dialog(self):
         region_text = self.home_world.region_name()
@@ -136,12 +145,11 @@ class _WorldListInteractionTuningDataBase(PythonBasedInteractionWithRegionData):
 
         return TestList(base_tests)
 
-    @classmethod
-    def _create_continuation(cls, source_world: HomeWorldIds, target_world: HomeWorldIds):
+    def _create_continuation(self, target_world: HomeWorldIds):
         args = dict()
         args['actor'] = ParticipantType.Actor
         args['target'] = ParticipantType.Object
-        args['affordance'] = cls.sub_interaction_cache[source_world][target_world]
+        args['affordance'] = self.get_sub_interaction(target_world)
         args['carry_target'] = None
         args['inventory_carry_target'] = None
         args['preserve_preferred_object'] = True
@@ -155,7 +163,7 @@ class _WorldListInteractionTuningDataBase(PythonBasedInteractionWithRegionData):
 
     def _create_picker_item(self, target_world: HomeWorldIds):
         args = dict()
-        args['continuation'] = (self._create_continuation(self.home_world, target_world),)
+        args['continuation'] = (self._create_continuation(target_world),)
         args['icon'] = self._get_picker_item_icon(target_world)
         args['item_description'] = None
         args['item_tooltip'] = None
@@ -205,15 +213,23 @@ class _WorldListInteractionTuningDataBase(PythonBasedInteractionWithRegionData):
         return lambda *args: self.picker_interaction_name(interaction_name, *args)
 
     def is_world_available(self, home_world: HomeWorldIds):
-        return home_world.is_available and home_world not in (self.home_world, HomeWorldIds.DEFAULT)
+        return home_world is not self.home_world and AvailableWorlds.is_world_available(home_world)
 
     @property
     def available_worlds(self):
-        return tuple(home_world for home_world in HomeWorldIds if self.is_world_available(home_world))
+        return tuple(home_world for home_world in HomeWorldIds.available_worlds if home_world is not self.home_world)
 
-    def possible_actions(self):
+    def _create_picker_items(self):
         return tuple(self._create_picker_item(world) for world in self.available_worlds)
 
+    def possible_actions(self):
+        from kuttoe_home_regions.settings import Settings
+
+        key = (self.home_world, self.alter_type)
+        version = (Settings.version, AvailableWorlds.snapshot.generation)
+
+        return self.picker_row_cache.get(key, version, self._create_picker_items)
+
 
 class AllowWorldInteractionTuningData(_WorldListInteractionTuningDataBase):
     @constproperty
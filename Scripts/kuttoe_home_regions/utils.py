@@ -7,6 +7,8 @@ from typing import Set
 
 # python imports
 from functools import wraps
+from sys import getsizeof
+from time import perf_counter
 
 # game imports
 import enum
@@ -20,8 +22,11 @@ from sims4.tuning.dynamic_enum import DynamicEnum
 
 # miscellaneous
 import services
+from alarms import add_alarm_real_time, cancel_alarm
+from clock import interval_in_real_seconds
 from services import get_instance_manager
 from element_utils import CleanupType
+from zone_types import ZoneState
 from tag import Tag
 
 # interaction imports
@@ -119,7 +124,10 @@ def make_immutable_slots_class(**kwargs) -> _ImmutableSlotsBase:
     return make_immutable_slots(kwargs.keys())(kwargs)
 
 
-def construct_auto_init_factory(factory_cls, has_factory=True, **values):
+_AUTO_INIT_FACTORY_INFO = dict()
+
+
+def _get_auto_init_factory_info(factory_cls, has_factory=True):
     base = factory_cls.TunableFactory() if has_factory else factory_cls
     default = base._default
     factory = base.FACTORY_TYPE
@@ -131,10 +139,26 @@ def construct_auto_init_factory(factory_cls, has_factory=True, **values):
     keys_to_ignore = {'verify_tunable_callback', }
     keys = factory_keys - keys_to_ignore
 
-    factory_values = {key: getattr(default, key, None) for key in keys}
-    factory_values.update(values)
+    return factory, {key: getattr(default, key, None) for key in keys}
+
+
+def get_auto_init_factory_info(factory_cls, has_factory=True):
+    cache_key = (factory_cls, has_factory)
+
+    if cache_key not in _AUTO_INIT_FACTORY_INFO:
+        _AUTO_INIT_FACTORY_INFO[cache_key] = _get_auto_init_factory_info(factory_cls, has_factory)
+
+    return _AUTO_INIT_FACTORY_INFO[cache_key]
 
-    return factory(**factory_values)
+
+def clear_auto_init_factory_info():
+    _AUTO_INIT_FACTORY_INFO.clear()
+
+
+def construct_auto_init_factory(factory_cls, has_factory=True, **values):
+    factory, defaults = get_auto_init_factory_info(factory_cls, has_factory)
+
+    return factory(**{**defaults, **values})
 
 
 class CommandsList(tuple):
@@ -177,6 +201,13 @@ class CommandsList(tuple):
 
 
 def make_do_command(command_name: str, *additional_arguments):
+    def _builder():
+        return _make_do_command(command_name, *additional_arguments)
+
+    return ClassFactoryCache.get('do_command', (command_name, additional_arguments), _builder)
+
+
+def _make_do_command(command_name: str, *additional_arguments):
     class _RunCommand(DoCommand):
         @classproperty
         def factory(cls):
@@ -230,3 +261,244 @@ def does_zone_have_modifier(modifier: ZoneModifier, zone_id: int = None):
 
 def does_zone_have_modifiers(*modifiers: ZoneModifier, num_required: int = 1, zone_id: int = None):
     return len(get_zone_modifiers(zone_id) & set(modifiers)) >= num_required
+
+
+#######################################################################################################################
+#  Flyweights                                                                                                         #
+#######################################################################################################################
+
+
+def freeze_key(value):
+    if isinstance(value, dict):
+        return tuple(sorted(((key, freeze_key(item)) for (key, item) in value.items()), key=repr))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze_key(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_key(item) for item in value)
+
+    try:
+        hash(value)
+    except TypeError:
+        raise TypeError('Cannot freeze unhashable value of type {}'.format(type(value).__name__))
+
+    return value
+
+
+class FlyweightRegistry:
+    PROFILER_SECTION = 'flyweights'
+    _INSTANCES = dict()
+    _REQUESTS = dict()
+    _SIZES = dict()
+
+    @staticmethod
+    def _get_shallow_size(instance) -> int:
+        return getsizeof(instance) + getsizeof(getattr(instance, '__dict__', None))
+
+    @classmethod
+    def get(cls, key_type, builder=None, **args):
+        try:
+            key = (key_type, freeze_key(args))
+        except TypeError:
+            return (builder or key_type)(**args)
+
+        cls._REQUESTS[key] = cls._REQUESTS.get(key, 0) + 1
+
+        if key not in cls._INSTANCES:
+            instance = (builder or key_type)(**args)
+            cls._INSTANCES[key] = instance
+            cls._SIZES[key] = cls._get_shallow_size(instance)
+
+        return cls._INSTANCES[key]
+
+    @classmethod
+    def construct(cls, factory_cls, has_factory=True, **values):
+        def _builder(**args):
+            return construct_auto_init_factory(factory_cls, has_factory=has_factory, **args)
+
+        return cls.get(factory_cls, builder=_builder, **values)
+
+    @classmethod
+    def clear(cls):
+        from kuttoe_home_regions.profiling import StartupProfiler
+
+        cls._INSTANCES.clear()
+        cls._REQUESTS.clear()
+        cls._SIZES.clear()
+        StartupProfiler.clear(cls.PROFILER_SECTION)
+
+    @classproperty
+    def stats(cls):
+        args = dict()
+        args['requested'] = sum(cls._REQUESTS.values())
+        args['created'] = len(cls._INSTANCES)
+        args['shallow_bytes_before'] = sum(cls._SIZES[key] * count for (key, count) in cls._REQUESTS.items())
+        args['shallow_bytes_after'] = sum(cls._SIZES.values())
+
+        return args
+
+    @classmethod
+    def report(cls):
+        from kuttoe_home_regions.profiling import StartupProfiler
+
+        StartupProfiler.record(cls.PROFILER_SECTION, **cls.stats)
+
+
+#######################################################################################################################
+#  Class Factory Caches                                                                                               #
+#######################################################################################################################
+
+
+class ClassFactoryCache:
+    PROFILER_SECTION = 'class_factories'
+    _CLASSES = dict()
+
+    @classmethod
+    def get(cls, factory_name: str, spec, builder):
+        from kuttoe_home_regions.profiling import StartupProfiler
+
+        key = (factory_name, freeze_key(spec))
+        StartupProfiler.increment(cls.PROFILER_SECTION, '{}_requested'.format(factory_name))
+
+        if key not in cls._CLASSES:
+            start_time = perf_counter()
+            cls._CLASSES[key] = builder()
+            StartupProfiler.increment(cls.PROFILER_SECTION, '{}_created'.format(factory_name))
+            StartupProfiler.increment(cls.PROFILER_SECTION, '{}_creation_time'.format(factory_name),
+                                      perf_counter() - start_time)
+
+        return cls._CLASSES[key]
+
+    @classmethod
+    def clear(cls, factory_name: str = None):
+        if factory_name is None:
+            cls._CLASSES.clear()
+            return
+
+        for key in tuple(cls._CLASSES):
+            if key[0] == factory_name:
+                del cls._CLASSES[key]
+
+
+#######################################################################################################################
+#  Versioned Caches                                                                                                   #
+#######################################################################################################################
+
+
+class VersionedCache:
+    def __init__(self):
+        self._entries = dict()
+
+    def get(self, key, version, factory):
+        entry = self._entries.get(key, None)
+
+        if entry is None or entry[0] != version:
+            entry = (version, factory())
+            self._entries[key] = entry
+
+        return entry[1]
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+#######################################################################################################################
+#  Time Sliced Jobs                                                                                                   #
+#######################################################################################################################
+
+
+class TimeSlicedJob:
+    DEFAULT_BUDGET_MS = 5.0
+    DEFAULT_INTERVAL = 0.1
+
+    def __init__(self, items, step, on_complete=None, budget_ms: float = DEFAULT_BUDGET_MS,
+                 interval: float = DEFAULT_INTERVAL):
+        self._items = iter(items)
+        self._step = step
+        self._on_complete = on_complete
+        self._budget_ms = budget_ms
+        self._interval = interval
+        self._alarm_handle = None
+        self._alarm_zone_id = None
+        self._processed = 0
+        self._is_done = False
+
+    @property
+    def processed(self) -> int:
+        return self._processed
+
+    @property
+    def is_done(self) -> bool:
+        return self._is_done
+
+    @property
+    def is_running(self) -> bool:
+        return self._alarm_handle is not None and self._alarm_zone_id == services.current_zone_id()
+
+    def run_slice(self) -> bool:
+        deadline = perf_counter() + self._budget_ms / 1000
+
+        for item in self._items:
+            self._step(item)
+            self._processed += 1
+
+            if perf_counter() >= deadline:
+                return False
+
+        self._finish()
+        return True
+
+    def _on_alarm(self, _):
+        self.run_slice()
+
+    def _on_zone_shutdown(self, *_):
+        self._alarm_handle = None
+        self._alarm_zone_id = None
+
+    def _clear_dead_alarm(self):
+        if self._alarm_handle is not None and not self.is_running:
+            self._on_zone_shutdown()
+
+    def _cancel_alarm(self):
+        self._clear_dead_alarm()
+        if self._alarm_handle is None:
+            return
+
+        cancel_alarm(self._alarm_handle)
+        zone = services.current_zone()
+        if zone is not None:
+            zone.unregister_callback(ZoneState.SHUTDOWN_STARTED, self._on_zone_shutdown)
+        self._on_zone_shutdown()
+
+    def _arm_alarm(self):
+        time_span = interval_in_real_seconds(self._interval)
+        self._alarm_handle = add_alarm_real_time(self, time_span, self._on_alarm, repeating=True)
+        self._alarm_zone_id = services.current_zone_id()
+
+        zone = services.current_zone()
+        if zone is not None:
+            zone.register_callback(ZoneState.SHUTDOWN_STARTED, self._on_zone_shutdown)
+
+    def _finish(self):
+        self._cancel_alarm()
+        self._is_done = True
+
+        if self._on_complete is not None:
+            self._on_complete(self)
+
+    def start(self):
+        self._clear_dead_alarm()
+        if self.is_done or self.is_running or self.run_slice():
+            return self
+
+        self._arm_alarm()
+        return self
+
+    def pause(self):
+        self._cancel_alarm()
+
+    def cancel(self):
+        self._cancel_alarm()
+        self._is_done = True